@@ -6,11 +6,12 @@ import os
 import tempfile
 from pathlib import Path
 from typing import TYPE_CHECKING
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import Mock, patch
 
 import pytest
 
 from viseron.components.storage import Storage, _get_tier_config
+from viseron.components.storage.config import STORAGE_SCHEMA
 from viseron.components.storage.const import (
     CONFIG_CHECK_INTERVAL,
     CONFIG_CONTINUOUS,
@@ -21,6 +22,7 @@ from viseron.components.storage.const import (
     CONFIG_MOVE_ON_SHUTDOWN,
     CONFIG_PATH,
     CONFIG_POLL,
+    CONFIG_POLL_INTERVAL,
     CONFIG_RECORDER,
     CONFIG_SECONDS,
     CONFIG_SNAPSHOTS,
@@ -72,6 +74,7 @@ CONFIG = {
                             CONFIG_EVENTS: {"test": 456},
                             CONFIG_MOVE_ON_SHUTDOWN: False,
                             CONFIG_POLL: False,
+                            CONFIG_POLL_INTERVAL: 1,
                         },
                     ]
                 },
@@ -134,7 +137,7 @@ class TestStorage:
     def setup_method(self, vis: Viseron) -> None:
         """Set up the test."""
         with patch("viseron.components.storage.CleanupManager"):
-            self._storage = Storage(vis, MagicMock())
+            self._storage = Storage(vis, STORAGE_SCHEMA({}))
 
     def test_search_file(self) -> None:
         """Test the search_file method."""
@@ -159,3 +162,17 @@ class TestStorage:
                 "test_subcategory",
                 os.path.join(tier1, "test_path"),
             ) == os.path.join(tier2, "test_path")
+
+    def test_get_observer(self) -> None:
+        """Test that observers are shared and stopped on shutdown."""
+        observer = self._storage.get_observer(None)
+        polling_observer = self._storage.get_observer(5)
+        assert self._storage.get_observer(None) is observer
+        assert self._storage.get_observer(5) is polling_observer
+        assert observer is not polling_observer
+        assert observer.is_alive()
+        assert polling_observer.is_alive()
+
+        self._storage._shutdown()
+        assert not observer.is_alive()
+        assert not polling_observer.is_alive()
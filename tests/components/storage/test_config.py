@@ -55,6 +55,7 @@ def create_tier(
     continuous=None,
     move_on_shutdown=False,
     poll=False,
+    poll_interval=1,
     check_interval=None,
 ):
     """Create a standardized tier configuration."""
@@ -64,6 +65,7 @@ def create_tier(
         "continuous": create_retain_config(**(continuous or {})),
         "move_on_shutdown": move_on_shutdown,
         "poll": poll,
+        "poll_interval": poll_interval,
         "check_interval": create_check_interval(**(check_interval or {})),
     }
 
@@ -72,6 +74,7 @@ def create_tier_snapshots(
     path="/",
     move_on_shutdown=False,
     poll=False,
+    poll_interval=1,
     check_interval=None,
     max_age=None,
     min_age=None,
@@ -83,6 +86,7 @@ def create_tier_snapshots(
         "path": path,
         "move_on_shutdown": move_on_shutdown,
         "poll": poll,
+        "poll_interval": poll_interval,
         "check_interval": create_check_interval(**(check_interval or {})),
         **create_retain_config(
             max_age=max_age, min_age=min_age, max_size=max_size, min_size=min_size
@@ -100,6 +104,7 @@ DEFAULT_CONFIG = {
                     **create_retain_config(max_age={"days": 7}),
                     "move_on_shutdown": False,
                     "poll": False,
+                    "poll_interval": 1,
                     "check_interval": create_check_interval(),
                 }
             ],
@@ -108,6 +113,7 @@ DEFAULT_CONFIG = {
             "motion_detector": None,
             "object_detector": None,
         },
+        "file_workers": 8,
     },
 }
 
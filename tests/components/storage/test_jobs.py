@@ -0,0 +1,52 @@
+"""Test storage cleanup jobs."""
+# pylint: disable=protected-access
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+from viseron.components.storage.jobs import OrphanedFilesCleanup
+from viseron.types import SnapshotDomain
+
+from tests.common import MockCamera
+
+
+def _mock_storage() -> MagicMock:
+    """Return a storage mock that builds paths from the camera identifier."""
+    storage = MagicMock()
+    storage.get_recordings_path.side_effect = lambda camera: (
+        f"/recordings/{camera.identifier}"
+    )
+    storage.get_segments_path.side_effect = lambda camera: (
+        f"/segments/{camera.identifier}"
+    )
+    storage.get_thumbnails_path.side_effect = lambda camera: (
+        f"/thumbnails/{camera.identifier}"
+    )
+    storage.get_snapshots_path.side_effect = lambda camera, domain: (
+        f"/snapshots/{domain.value}/{camera.identifier}"
+    )
+    return storage
+
+
+def test_orphaned_files_cleanup_walks_each_path_once() -> None:
+    """Test that each camera path is walked once regardless of camera count."""
+    cameras = {
+        "camera_1": MockCamera(identifier="camera_1"),
+        "camera_2": MockCamera(identifier="camera_2"),
+    }
+    vis = MagicMock()
+    vis.get_registered_identifiers.return_value = cameras
+    job = OrphanedFilesCleanup(vis, _mock_storage(), MagicMock())
+
+    with patch("viseron.components.storage.jobs.os.walk", return_value=[]) as mock_walk:
+        job._run()
+
+    walked = [call.args[0] for call in mock_walk.call_args_list]
+    expected = []
+    for identifier in cameras:
+        expected += [
+            f"/recordings/{identifier}",
+            f"/segments/{identifier}",
+            f"/thumbnails/{identifier}",
+        ] + [f"/snapshots/{domain.value}/{identifier}" for domain in SnapshotDomain]
+    assert walked == expected
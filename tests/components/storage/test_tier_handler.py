@@ -1,26 +1,54 @@
 """Test the TierHandler class."""
 
+import errno
+import os
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+from typing import Any
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
-from sqlalchemy import select
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session
+from watchdog.events import (
+    DirModifiedEvent,
+    FileClosedEvent,
+    FileCreatedEvent,
+    FileDeletedEvent,
+    FileModifiedEvent,
+    FileOpenedEvent,
+    FileSystemEvent,
+)
 
 from viseron import Viseron
 from viseron.components.storage import Storage
 from viseron.components.storage.const import (
     COMPONENT as STORAGE_COMPONENT,
+    CONFIG_PATH,
     CONFIG_RECORDER,
 )
-from viseron.components.storage.models import Recordings
+from viseron.components.storage.models import Files, FilesMeta, Recordings
 from viseron.components.storage.tier_handler import (
     RecordingsTierHandler,
     SegmentsTierHandler,
     ThumbnailTierHandler,
+    TierHandler,
+    _fast_copy,
+    _relocate_file,
+    bulk_move_files,
+    chunked,
     find_next_tier_segments,
+    force_move_files,
     handle_file,
+    move_file,
 )
+from viseron.components.storage.util import EventFileDeletedBatch
 from viseron.domains.camera.const import CONFIG_LOOKBACK
+from viseron.helpers import utcnow
 
 from tests.common import BaseTestWithRecordings
 
@@ -43,6 +71,25 @@ def test_handle_file_delete(
     mock_delete_file.assert_called_once_with(session, file, logger)
 
 
+@pytest.mark.parametrize("row_deleted", [True, False])
+@patch("viseron.components.storage.tier_handler.move_file")
+def test_handle_file_stale_tier_path(mock_move_file: Mock, row_deleted: bool) -> None:
+    """Test that rows from old tier paths are only deleted if not already done."""
+    mock_move_file.return_value = row_deleted
+    get_session = MagicMock()
+    handle_file(
+        get_session,
+        MagicMock(),
+        "test",
+        {"path": "/tmp/tier1/"},
+        {"path": "/tmp/tier2/"},
+        "/tmp/old_tier1/file1",
+        "/tmp/old_tier1/",
+        MagicMock(),
+    )
+    assert get_session.called is not row_deleted
+
+
 @patch("viseron.components.storage.tier_handler.move_file")
 def test_handle_file_move(
     mock_move_file: Mock,
@@ -61,7 +108,362 @@ def test_handle_file_move(
     handle_file(
         session, MagicMock(), "test", tier_1, tier_2, tier_1_file, "/tmp/tier1/", logger
     )
-    mock_move_file.assert_called_once_with(session, tier_1_file, tier_2_file, logger)
+    mock_move_file.assert_called_once_with(
+        session, tier_1_file, tier_2_file, logger, seen_dirs=None
+    )
+
+
+def _insert_file(
+    session: Session, path: Path, tier_path: Path, meta: dict[str, Any] | None = None
+) -> None:
+    """Insert a Files row for path, and a FilesMeta row if meta is given."""
+    session.execute(
+        insert(Files).values(
+            tier_id=0,
+            tier_path=str(tier_path),
+            camera_identifier="test",
+            category="recorder",
+            subcategory="segments",
+            path=str(path),
+            directory=str(path.parent),
+            filename=path.name,
+            size=1,
+        )
+    )
+    if meta is not None:
+        session.execute(
+            insert(FilesMeta).values(path=str(path), orig_ctime=utcnow(), meta=meta)
+        )
+
+
+def _create_files(
+    get_db_session: Callable[[], Session], tmp_path: Path, with_meta: int
+) -> list[tuple[str, str]]:
+    """Create three files in tier1 and return their (src, dst) paths in tier2.
+
+    Metadata is only inserted for the first with_meta files.
+    """
+    tier_1 = tmp_path / "tier1"
+    files = []
+    with get_db_session() as session:
+        for i in range(3):
+            src = tier_1 / "segments" / f"{i}.m4s"
+            src.parent.mkdir(parents=True, exist_ok=True)
+            src.write_text(str(i))
+            files.append((str(src), str(tmp_path / "tier2" / "segments" / src.name)))
+            _insert_file(
+                session, src, tier_1, {"m3u8": {"i": i}} if i < with_meta else None
+            )
+        session.commit()
+    return files
+
+
+@pytest.mark.parametrize("use_executor", [False, True])
+def test_bulk_move_files(
+    get_db_session: Callable[[], Session], tmp_path, use_executor: bool
+) -> None:
+    """Test that bulk_move_files moves files and their metadata."""
+    # Leave out the metadata for the last file
+    files = _create_files(get_db_session, tmp_path, with_meta=2)
+
+    if use_executor:
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            bulk_move_files(get_db_session, files, MagicMock(), executor)
+    else:
+        bulk_move_files(get_db_session, files, MagicMock())
+
+    assert os.path.exists(files[0][1])
+    assert os.path.exists(files[1][1])
+    assert not os.path.exists(files[2][1])
+    assert not any(os.path.exists(src) for src, _ in files)
+    with get_db_session() as session:
+        assert not session.execute(select(Files)).all()
+        files_meta = session.execute(select(FilesMeta)).scalars().all()
+        assert sorted((meta.path, meta.meta["m3u8"]["i"]) for meta in files_meta) == [
+            (files[0][1], 0),
+            (files[1][1], 1),
+        ]
+
+
+def test_bulk_move_files_error(get_db_session: Callable[[], Session], tmp_path) -> None:
+    """Test that files that fail to move are kept in the database."""
+    files = _create_files(get_db_session, tmp_path, with_meta=3)
+
+    def _relocate_file_side_effect(src: str, dst: str) -> None:
+        if src == files[1][0]:
+            raise PermissionError(errno.EACCES, "Permission denied")
+        _relocate_file(src, dst)
+
+    logger = MagicMock()
+    with patch(
+        "viseron.components.storage.tier_handler._relocate_file",
+        side_effect=_relocate_file_side_effect,
+    ):
+        bulk_move_files(get_db_session, files, logger)
+
+    logger.error.assert_called_once()
+    assert os.path.exists(files[0][1])
+    assert os.path.exists(files[1][0])
+    assert os.path.exists(files[2][1])
+    with get_db_session() as session:
+        assert session.execute(select(Files.path)).scalars().all() == [files[1][0]]
+        assert files[1][0] in session.execute(select(FilesMeta.path)).scalars().all()
+
+
+def test_move_file(get_db_session: Callable[[], Session], tmp_path) -> None:
+    """Test that move_file copies the metadata and moves the file."""
+    src = tmp_path / "tier1" / "0.m4s"
+    dst = tmp_path / "tier2" / "0.m4s"
+    src.parent.mkdir()
+    src.write_text("0")
+    with get_db_session() as session:
+        session.execute(
+            insert(FilesMeta).values(
+                path=str(src), orig_ctime=utcnow(), meta={"m3u8": {"i": 0}}
+            )
+        )
+        session.commit()
+
+    move_file(get_db_session, str(src), str(dst), MagicMock())
+
+    assert not os.path.exists(src)
+    assert os.path.exists(dst)
+    with get_db_session() as session:
+        files_meta = (
+            session.execute(select(FilesMeta).where(FilesMeta.path == str(dst)))
+            .scalars()
+            .one()
+        )
+        assert files_meta.meta == {"m3u8": {"i": 0}}
+
+    # Without metadata the source file is removed instead of moved
+    missing_src = tmp_path / "tier1" / "1.m4s"
+    missing_src.write_text("1")
+    missing_dst = tmp_path / "tier2" / "1.m4s"
+    move_file(get_db_session, str(missing_src), str(missing_dst), MagicMock())
+    assert not os.path.exists(missing_src)
+    assert not os.path.exists(missing_dst)
+
+
+def test_relocate_file(tmp_path) -> None:
+    """Test that _relocate_file renames and falls back to copying."""
+    src = tmp_path / "src.m4s"
+    dst = tmp_path / "dst.m4s"
+    src.write_text("0")
+    with patch("viseron.components.storage.tier_handler.shutil.copy") as mock_copy:
+        _relocate_file(str(src), str(dst))
+        mock_copy.assert_not_called()
+    assert not os.path.exists(src)
+    assert dst.read_text() == "0"
+
+    with patch(
+        "viseron.components.storage.tier_handler.os.rename",
+        side_effect=OSError(errno.EXDEV, "Invalid cross-device link"),
+    ):
+        _relocate_file(str(dst), str(src))
+    assert not os.path.exists(dst)
+    assert src.read_text() == "0"
+
+
+def test_fast_copy(tmp_path) -> None:
+    """Test that _fast_copy copies the data and falls back to shutil.copyfile."""
+    src = tmp_path / "src.m4s"
+    src.write_bytes(os.urandom(1024 * 1024 + 1))
+    _fast_copy(str(src), str(tmp_path / "dst1.m4s"))
+    assert (tmp_path / "dst1.m4s").read_bytes() == src.read_bytes()
+
+    with patch(
+        "viseron.components.storage.tier_handler.os.copy_file_range",
+        side_effect=OSError(errno.ENOSYS, "Function not implemented"),
+    ):
+        _fast_copy(str(src), str(tmp_path / "dst2.m4s"))
+    assert (tmp_path / "dst2.m4s").read_bytes() == src.read_bytes()
+
+    # A short copy must not be reported as a success
+    with patch(
+        "viseron.components.storage.tier_handler.os.copy_file_range",
+        return_value=0,
+    ) as mock_copy_file_range:
+        _fast_copy(str(src), str(tmp_path / "dst3.m4s"))
+    mock_copy_file_range.assert_called_once()
+    assert (tmp_path / "dst3.m4s").read_bytes() == src.read_bytes()
+
+
+def test_chunked() -> None:
+    """Test that chunked splits rows into lists of at most size."""
+    assert list(chunked(range(7), 3)) == [[0, 1, 2], [3, 4, 5], [6]]
+    assert not list(chunked([], 3))
+
+
+def _tier_handler_mock(get_db_session: Callable[[], Session], tmp_path) -> MagicMock:
+    """Return a mocked TierHandler that writes events to the database."""
+    # pylint: disable=protected-access
+    tier_handler = MagicMock(
+        _tier_path=str(tmp_path),
+        _tier_id=0,
+        _category="recorder",
+        _subcategory="segments",
+    )
+    tier_handler._camera.identifier = "test"
+    tier_handler._storage.get_session = get_db_session
+    tier_handler._event_deque = deque()
+    for method in ("_on_created", "_on_deleted", "_flush_event_groups"):
+        getattr(tier_handler, method).side_effect = partial(
+            getattr(TierHandler, method), tier_handler
+        )
+    return tier_handler
+
+
+def test_process_event_batch(get_db_session: Callable[[], Session], tmp_path) -> None:
+    """Test that queued events are written to the database in batches."""
+    # pylint: disable=protected-access
+    paths = []
+    for i in range(3):
+        path = tmp_path / f"{i}.m4s"
+        path.write_text(str(i))
+        paths.append(str(path))
+    tier_handler = _tier_handler_mock(get_db_session, tmp_path)
+
+    # The events the native observer emits when the files are written and one of
+    # them is deleted again
+    events: list[FileSystemEvent] = []
+    for path in paths:
+        events += [
+            FileCreatedEvent(path),
+            DirModifiedEvent(str(tmp_path)),
+            FileOpenedEvent(path),
+            FileModifiedEvent(path),
+            FileClosedEvent(path),
+            DirModifiedEvent(str(tmp_path)),
+        ]
+    events += [FileDeletedEvent(paths[2]), DirModifiedEvent(str(tmp_path))]
+    for event in events:
+        TierHandler.on_any_event(tier_handler, event)
+    assert len(tier_handler._event_deque) == 7
+
+    TierHandler._process_event_batch(tier_handler)
+
+    assert not tier_handler._event_deque
+    tier_handler._on_created.assert_called_once()
+    assert [
+        event.src_path for event, _ in tier_handler._on_created.call_args.args[0]
+    ] == paths
+    assert tier_handler._on_modified.call_count == 3
+    tier_handler._on_deleted.assert_called_once()
+    tier_handler.check_tier.assert_called_once()
+    assert tier_handler._vis.dispatch_event.call_count == 4
+    tier_handler._vis.dispatch_event.assert_called_with(
+        "file_deleted_batch/test/recorder/segments",
+        EventFileDeletedBatch(
+            camera_identifier="test",
+            category="recorder",
+            subcategory="segments",
+            paths=(paths[2],),
+        ),
+    )
+    with get_db_session() as session:
+        files = session.execute(select(Files.path, Files.size)).all()
+        assert sorted(files) == [(paths[0], 1), (paths[1], 1)]
+
+
+def test_process_event_batch_deleted(
+    get_db_session: Callable[[], Session], tmp_path
+) -> None:
+    """Test that a burst of deleted files is dispatched as a single event."""
+    # pylint: disable=protected-access
+    paths = [str(tmp_path / f"{i}.m4s") for i in range(3)]
+    tier_handler = _tier_handler_mock(get_db_session, tmp_path)
+    for path in paths:
+        TierHandler.on_any_event(tier_handler, FileDeletedEvent(path))
+        TierHandler.on_any_event(tier_handler, DirModifiedEvent(str(tmp_path)))
+
+    TierHandler._process_event_batch(tier_handler)
+
+    tier_handler._on_deleted.assert_called_once()
+    tier_handler._vis.dispatch_event.assert_called_once_with(
+        "file_deleted_batch/test/recorder/segments",
+        EventFileDeletedBatch(
+            camera_identifier="test",
+            category="recorder",
+            subcategory="segments",
+            paths=tuple(paths),
+        ),
+    )
+
+
+def test_update_sizes(get_db_session: Callable[[], Session], tmp_path) -> None:
+    """Test that sizes are updated and the tier check runs on the event thread."""
+    # pylint: disable=protected-access
+    path = tmp_path / "0.m4s"
+    path.write_text("0123456789")
+    with get_db_session() as session:
+        _insert_file(session, path, tmp_path)
+        session.commit()
+    tier_handler = _tier_handler_mock(get_db_session, tmp_path)
+    tier_handler._check_tier_requested = False
+
+    TierHandler._update_sizes(tier_handler, [str(path)])
+
+    with get_db_session() as session:
+        assert session.execute(select(Files.size)).scalar_one() == 10
+    tier_handler.check_tier.assert_not_called()
+    assert tier_handler._check_tier_requested
+    tier_handler._event_ready.set.assert_called_once()
+
+    tier_handler._stopping = True
+    TierHandler._process_events(tier_handler)
+    tier_handler.check_tier.assert_called_once()
+    assert not tier_handler._check_tier_requested
+
+
+def test_force_move_files_chunks(get_db_session: Callable[[], Session]) -> None:
+    """Test that force_move_files hands the files of a tier over in chunks."""
+    with get_db_session() as session:
+        for i in range(5):
+            _insert_file(session, Path("/tier1") / f"{i}.m4s", Path("/tier1"))
+        session.commit()
+
+    with patch(
+        "viseron.components.storage.tier_handler.TIER_CHECK_CHUNK_SIZE", 2
+    ), patch(
+        "viseron.components.storage.tier_handler.handle_files"
+    ) as mock_handle_files:
+        force_move_files(
+            MagicMock(),
+            get_db_session,
+            "recorder",
+            "segments",
+            0,
+            "test",
+            {},
+            None,
+            MagicMock(),
+        )
+
+    assert [len(call.args[5]) for call in mock_handle_files.call_args_list] == [2, 2, 1]
+
+
+def test_clip_path_candidates() -> None:
+    """Test that clip path candidates are built from the other tiers."""
+    # pylint: disable=protected-access
+    tier_handler = MagicMock(
+        _path="/tier2/recordings/test",
+        _category="recorder",
+        _subcategory="recordings",
+    )
+    tier_handler._camera.identifier = "test"
+    tier_handler._storage.camera_tier_handlers = {
+        "test": {
+            "recorder": [
+                {"recordings": Mock(tier={CONFIG_PATH: "/tier1/"})},
+                {"recordings": tier_handler},
+                {"recordings": Mock(tier={CONFIG_PATH: "/tier3/"})},
+            ]
+        }
+    }
+    assert RecordingsTierHandler._clip_path_candidates(
+        tier_handler, "/tier2/recordings/test/clip.mp4"
+    ) == ["/tier1/recordings/test/clip.mp4", "/tier3/recordings/test/clip.mp4"]
 
 
 @dataclass
@@ -163,6 +565,8 @@ class TestSegmentsTierHandler(BaseTestWithRecordings):
             "viseron.components.storage.tier_handler.files_to_move_overlap"
         ) as mock_files_to_move_overlap, patch(
             "viseron.components.storage.tier_handler.handle_file"
+        ), patch(
+            "viseron.components.storage.tier_handler.handle_files"
         ):
             mock_get_recordings_to_move.return_value = [
                 MockRecordingsQueryResult(1, 1, "/tmp/test1.mp4", "/tmp/"),
@@ -317,6 +721,7 @@ class TestSegmentsTierHandler(BaseTestWithRecordings):
                 "/tmp/",
                 tier_handlers[0]._logger,  # pylint: disable=protected-access
                 force_delete=force_delete,
+                seen_dirs=set(),
             )
             if move_thumbnail_called:
                 thumbnail_tier_handler.move_thumbnail.assert_called_once_with(
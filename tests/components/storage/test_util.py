@@ -1,15 +1,30 @@
 """Test the util module."""
+# pylint: disable=protected-access
 
+import os
 from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
 
+import pytest
+
+from viseron.components.storage.const import UNLINK_CHUNK_SIZE
 from viseron.components.storage.util import (
+    Debouncer,
+    RequestedFilesCount,
+    batch_unlink,
     calculate_age,
     calculate_bytes,
     files_to_move_overlap,
+    get_recorder_path,
+    get_snapshots_path,
+    get_thumbnails_path,
 )
+from viseron.types import SnapshotDomain
+
+from tests.common import MockCamera
 
 EventsFiles = namedtuple("EventsFiles", "recording_id file_id path")
-ContinuousFiles = namedtuple("ContinuousFiles", "id path")
 
 
 def test_calculate_bytes() -> None:
@@ -36,6 +51,19 @@ def test_calculate_age() -> None:
     assert calculate_age({"minutes": 1, "days": 1, "hours": 1}).total_seconds() == 90060
 
 
+def test_get_paths() -> None:
+    """Test the get_*_path functions."""
+    tier = {"path": "/tier1/"}
+    camera = MockCamera(identifier="test_camera")
+    assert get_recorder_path(tier, camera, "segments") == (
+        "/tier1/segments/test_camera"
+    )
+    assert get_thumbnails_path(tier, camera) == "/tier1/thumbnails/test_camera"
+    assert get_snapshots_path(tier, camera, SnapshotDomain.OBJECT_DETECTOR) == (
+        "/tier1/snapshots/object_detector/test_camera"
+    )
+
+
 def test_files_to_move_overlap() -> None:
     """Test files_to_move_overlap."""
     events_file_ids = [
@@ -44,13 +72,140 @@ def test_files_to_move_overlap() -> None:
         EventsFiles("recording2", "file3", "path3"),
         EventsFiles("recording2", "file4", "path4"),
     ]
-    continuous_file_ids = [
-        ContinuousFiles("file2", "path2"),
-        ContinuousFiles("file3", "path3"),
-    ]
+    continuous_ids = {"file2", "file3"}
 
-    result = files_to_move_overlap(events_file_ids, continuous_file_ids)
+    result = files_to_move_overlap(events_file_ids, continuous_ids)
     assert result == [
         EventsFiles("recording1", "file2", "path2"),
         EventsFiles("recording2", "file3", "path3"),
     ]
+
+
+@pytest.mark.parametrize("use_executor", [False, True])
+def test_batch_unlink(tmp_path, use_executor: bool) -> None:
+    """Test batch_unlink."""
+    first = tmp_path / "first"
+    second = tmp_path / "second"
+    first.mkdir()
+    second.mkdir()
+    paths = [
+        str(first / "1.mp4"),
+        str(first / "2.mp4"),
+        str(second / "3.mp4"),
+    ]
+    for path in paths:
+        open(path, "w", encoding="utf-8").close()
+
+    missing = [str(first / "missing.mp4"), str(tmp_path / "missing" / "4.mp4")]
+    if use_executor:
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            failed = batch_unlink(paths + missing, executor)
+    else:
+        failed = batch_unlink(paths + missing)
+    assert list(failed) == missing
+    assert all(isinstance(error, FileNotFoundError) for error in failed.values())
+    assert not any(os.path.exists(path) for path in paths)
+
+
+def test_batch_unlink_relative(tmp_path, monkeypatch) -> None:
+    """Test that relative paths are resolved against the working directory."""
+    monkeypatch.chdir(tmp_path)
+    open("1.mp4", "w", encoding="utf-8").close()
+
+    failed = batch_unlink(["1.mp4", "missing.mp4"])
+    assert list(failed) == ["missing.mp4"]
+    assert not (tmp_path / "1.mp4").exists()
+
+
+def test_batch_unlink_chunks(tmp_path) -> None:
+    """Test that files in a single directory are unlinked in chunks."""
+    paths = [str(tmp_path / f"{i}.m4s") for i in range(UNLINK_CHUNK_SIZE * 2 + 1)]
+    for path in paths:
+        open(path, "w", encoding="utf-8").close()
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        executor = MagicMock(wraps=pool)
+        assert not batch_unlink(paths, executor)
+        assert not any(os.path.exists(path) for path in paths)
+        _, directories, file_names = executor.map.call_args.args
+        assert list(directories) == [str(tmp_path)] * 3
+        assert [len(chunk) for chunk in file_names] == [
+            UNLINK_CHUNK_SIZE,
+            UNLINK_CHUNK_SIZE,
+            1,
+        ]
+
+        # Batches that fit in one chunk are unlinked without the executor
+        executor.reset_mock()
+        path = tmp_path / "single.m4s"
+        path.touch()
+        assert not batch_unlink([str(path)], executor)
+        assert not path.exists()
+        executor.map.assert_not_called()
+
+
+def test_requested_files_count() -> None:
+    """Test that requested filenames are removed when they expire."""
+    requested_files_count = RequestedFilesCount()
+    requested_files_count("file1")
+    requested_files_count("file1")
+    with requested_files_count("file2") as count:
+        assert count == 1
+    assert requested_files_count.count == 0
+    assert requested_files_count.filenames == {"file1": 2, "file2": 1}
+
+    reaper = requested_files_count._reaper
+    assert reaper is not None
+    with requested_files_count._condition:
+        # Expire all filenames immediately
+        requested_files_count._expirations = [
+            (0, filename) for _, filename in requested_files_count._expirations
+        ]
+        requested_files_count._condition.notify()
+    reaper.join(timeout=1)
+
+    assert not reaper.is_alive()
+    assert "file1" not in requested_files_count.filenames
+    assert "file2" not in requested_files_count.filenames
+    assert requested_files_count._reaper is None
+
+
+def test_debouncer() -> None:
+    """Test that expired paths are passed to their callback in one call."""
+    debouncer = Debouncer(delay=0.05)
+    callback = MagicMock()
+    other_callback = MagicMock()
+    debouncer.schedule("/file1", callback)
+    debouncer.schedule("/file2", callback)
+    debouncer.schedule("/file1", callback)
+    debouncer.schedule("/file3", other_callback)
+
+    worker = debouncer._worker
+    assert worker is not None
+    worker.join(timeout=1)
+
+    assert not worker.is_alive()
+    assert debouncer._worker is None
+    callback.assert_called_once_with(["/file1", "/file2"])
+    other_callback.assert_called_once_with(["/file3"])
+
+
+def test_debouncer_flush() -> None:
+    """Test that flush runs the callback for its pending paths right away."""
+    debouncer = Debouncer(delay=60)
+    callback = MagicMock()
+    other_callback = MagicMock()
+    debouncer.schedule("/file1", callback)
+    debouncer.schedule("/file2", other_callback)
+
+    debouncer.flush(callback)
+    callback.assert_called_once_with(["/file1"])
+    other_callback.assert_not_called()
+    assert list(debouncer._pending) == ["/file2"]
+
+    debouncer.flush(other_callback)
+    other_callback.assert_called_once_with(["/file2"])
+    worker = debouncer._worker
+    if worker is not None:
+        worker.join(timeout=1)
+        assert not worker.is_alive()
@@ -1,8 +1,11 @@
 """Test helpers module."""
 from contextlib import nullcontext
 from datetime import datetime, timedelta, timezone
+from queue import Queue
 
+import numpy as np
 import pytest
+import tornado.queues as tq
 
 from viseron import helpers
 
@@ -181,3 +184,40 @@ def test_microsecond_precision():
 
     assert time_from.microsecond == 0
     assert time_to.microsecond == 999999
+
+
+def test_calculate_absolute_coords_batch():
+    """Test that the batch helper matches calculate_absolute_coords."""
+    resolution = (1920, 1080)
+    relative = np.array(
+        [(0.039, 0.083, 0.055, 0.111), (0.0, 0.0, 1.0, 1.0), (-0.01, 0.5, 0.3, 1.2)]
+    )
+    absolute = helpers.calculate_absolute_coords_batch(relative, resolution)
+    assert absolute.dtype == np.int32
+    for index, bounding_box in enumerate(relative):
+        assert tuple(absolute[index]) == helpers.calculate_absolute_coords(
+            tuple(bounding_box), resolution
+        )
+
+
+def test_pop_if_full():
+    """Test that pop_if_full drops the oldest item of a full queue."""
+    queue: Queue = Queue(maxsize=2)
+    helpers.pop_if_full(queue, 1)
+    helpers.pop_if_full(queue, 2)
+    helpers.pop_if_full(queue, 3)
+    assert queue.qsize() == 2
+    assert queue.get_nowait() == 2
+    assert queue.get_nowait() == 3
+    queue.task_done()
+    queue.task_done()
+    assert queue.unfinished_tasks == 1
+
+
+def test_pop_if_full_tornado_queue():
+    """Test that pop_if_full drops the oldest item of a full tornado queue."""
+    queue: tq.Queue = tq.Queue(maxsize=1)
+    helpers.pop_if_full(queue, 1)
+    helpers.pop_if_full(queue, 2)
+    assert queue.qsize() == 1
+    assert queue.get_nowait() == 2
@@ -2,6 +2,8 @@
 
 from datetime import timedelta
 
+import pytest
+
 from viseron.domains.motion_detector.const import CONFIG_TRIGGER_RECORDER
 from viseron.domains.object_detector.const import (
     CONFIG_LABEL_CONFIDENCE,
@@ -19,6 +21,18 @@ from viseron.helpers import utcnow
 from viseron.helpers.filter import Filter
 
 FRAME_RES = (1920, 1080)
+OBJECT_FILTER_CONFIG = {
+    CONFIG_LABEL_LABEL: "person",
+    CONFIG_LABEL_CONFIDENCE: 0.8,
+    CONFIG_LABEL_WIDTH_MIN: 0.1,
+    CONFIG_LABEL_WIDTH_MAX: 0.5,
+    CONFIG_LABEL_HEIGHT_MIN: 0.1,
+    CONFIG_LABEL_HEIGHT_MAX: 0.5,
+    CONFIG_TRIGGER_RECORDER: True,
+    CONFIG_LABEL_REQUIRE_MOTION: False,
+    CONFIG_LABEL_STORE: True,
+    CONFIG_LABEL_STORE_INTERVAL: 10,
+}
 
 
 def test_should_store() -> None:
@@ -48,3 +62,27 @@ def test_should_store() -> None:
     )
     assert _filter.should_store(obj) is False
     assert obj.store is False
+
+
+@pytest.mark.parametrize(
+    "obj, expected, filter_hit",
+    [
+        (DetectedObject("person", 0.9, 0.1, 0.1, 0.3, 0.3, FRAME_RES), True, None),
+        (
+            DetectedObject("person", 0.7, 0.1, 0.1, 0.3, 0.3, FRAME_RES),
+            False,
+            "confidence",
+        ),
+        (DetectedObject("person", 0.9, 0.1, 0.1, 0.9, 0.3, FRAME_RES), False, "width"),
+        (
+            DetectedObject("person", 0.9, 0.1, 0.1, 0.3, 0.9, FRAME_RES),
+            False,
+            "height",
+        ),
+    ],
+)
+def test_filter_object(obj: DetectedObject, expected: bool, filter_hit) -> None:
+    """Test that filter_object returns the correct value and sets filter_hit."""
+    _filter = Filter(FRAME_RES, OBJECT_FILTER_CONFIG, [])
+    assert _filter.filter_object(obj) is expected
+    assert obj.filter_hit == filter_hit
@@ -5,7 +5,9 @@ import copy
 import logging
 import os
 import pathlib
+import threading
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, Any, TypedDict
 
 import voluptuous as vol
@@ -14,6 +16,9 @@ from alembic.config import Config
 from alembic.migration import MigrationContext
 from sqlalchemy import Engine, create_engine, update
 from sqlalchemy.orm import Session, scoped_session, sessionmaker
+from watchdog.observers import Observer
+from watchdog.observers.api import BaseObserver
+from watchdog.observers.polling import PollingObserverVFS
 
 from viseron.components.storage.config import (
     STORAGE_SCHEMA,
@@ -24,14 +29,17 @@ from viseron.components.storage.const import (
     COMPONENT,
     CONFIG_CONTINUOUS,
     CONFIG_EVENTS,
+    CONFIG_FILE_WORKERS,
     CONFIG_MOVE_ON_SHUTDOWN,
     CONFIG_PATH,
     CONFIG_POLL,
+    CONFIG_POLL_INTERVAL,
     CONFIG_RECORDER,
     CONFIG_SNAPSHOTS,
     CONFIG_TIERS,
     DATABASE_URL,
     DEFAULT_COMPONENT,
+    DEFAULT_POLL_INTERVAL,
     DESC_COMPONENT,
 )
 from viseron.components.storage.jobs import CleanupManager
@@ -44,6 +52,7 @@ from viseron.components.storage.tier_handler import (
 )
 from viseron.components.storage.triggers import setup_triggers
 from viseron.components.storage.util import (
+    Debouncer,
     RequestedFilesCount,
     get_recorder_path,
     get_snapshots_path,
@@ -177,8 +186,14 @@ class Storage:
         ] = {}
         self.camera_requested_files_count: dict[str, RequestedFilesCount] = {}
 
-        self.ignored_files: list[str] = []
+        self.ignored_files: frozenset[str] = frozenset()
         self.engine: Engine | None = None
+        self._observers: dict[int | None, BaseObserver] = {}
+        self._observers_lock = threading.Lock()
+        self._file_executor = ThreadPoolExecutor(
+            max_workers=config[CONFIG_FILE_WORKERS], thread_name_prefix="storage_file"
+        )
+        self._debouncer = Debouncer()
         self._get_session: Callable[[], Session] | None = None
 
         self._cleanup_manager = CleanupManager(vis, self)
@@ -189,6 +204,16 @@ class Storage:
         """Return camera tier handlers."""
         return self._camera_tier_handlers
 
+    @property
+    def file_executor(self) -> ThreadPoolExecutor:
+        """Return executor used to move and delete files."""
+        return self._file_executor
+
+    @property
+    def debouncer(self) -> Debouncer:
+        """Return debouncer shared by all tier handlers."""
+        return self._debouncer
+
     def initialize(self) -> None:
         """Initialize storage component."""
         self._alembic_cfg = self._get_alembic_config()
@@ -354,9 +379,11 @@ class Storage:
         """Add filename to ignore list.
 
         Ignored files will not be moved up tiers and are not stored in the database.
+        The set is replaced instead of mutated so that readers in other threads never
+        see it change while checking membership.
         """
         if filename not in self.ignored_files:
-            self.ignored_files.append(filename)
+            self.ignored_files = self.ignored_files | {filename}
 
     def _camera_registered(self, event_data: Event[AbstractCamera]) -> None:
         camera = event_data.data
@@ -394,8 +421,36 @@ class Storage:
                         next_tier,
                     )
 
+    def get_observer(self, poll_interval: int | None) -> BaseObserver:
+        """Return the file system observer shared by all tier handlers.
+
+        A polling observer is used if poll_interval is set, otherwise the native
+        observer. Each observer is started the first time it is requested.
+        """
+        with self._observers_lock:
+            if poll_interval not in self._observers:
+                observer = (
+                    PollingObserverVFS(
+                        stat=os.stat,
+                        listdir=os.scandir,
+                        polling_interval=poll_interval,
+                    )
+                    if poll_interval is not None
+                    else Observer()
+                )
+                observer.start()
+                self._observers[poll_interval] = observer
+            return self._observers[poll_interval]
+
     def _shutdown(self) -> None:
         """Shutdown."""
+        with self._observers_lock:
+            for observer in self._observers.values():
+                observer.stop()
+            for observer in self._observers.values():
+                observer.join()
+            self._observers.clear()
+        self._file_executor.shutdown()
         if self.engine:
             self.engine.dispose()
 
@@ -428,6 +483,7 @@ def _get_tier_config(config: dict[str, Any], camera: AbstractCamera) -> dict[str
         _tier[CONFIG_EVENTS] = events
         _tier[CONFIG_MOVE_ON_SHUTDOWN] = False
         _tier[CONFIG_POLL] = False
+        _tier[CONFIG_POLL_INTERVAL] = DEFAULT_POLL_INTERVAL
         tier_config[CONFIG_RECORDER][CONFIG_TIERS] = [_tier]
     elif camera.config[CONFIG_RECORDER][CONFIG_STORAGE]:
         _tier = camera.config[CONFIG_RECORDER][CONFIG_STORAGE][CONFIG_TIERS]
@@ -12,6 +12,7 @@ from viseron.components.storage.const import (
     CONFIG_DAYS,
     CONFIG_EVENTS,
     CONFIG_FACE_RECOGNITION,
+    CONFIG_FILE_WORKERS,
     CONFIG_GB,
     CONFIG_HOURS,
     CONFIG_LICENSE_PLATE_RECOGNITION,
@@ -26,6 +27,7 @@ from viseron.components.storage.const import (
     CONFIG_OBJECT_DETECTOR,
     CONFIG_PATH,
     CONFIG_POLL,
+    CONFIG_POLL_INTERVAL,
     CONFIG_RECORDER,
     CONFIG_SECONDS,
     CONFIG_SNAPSHOTS,
@@ -39,6 +41,7 @@ from viseron.components.storage.const import (
     DEFAULT_DAYS,
     DEFAULT_EVENTS,
     DEFAULT_FACE_RECOGNITION,
+    DEFAULT_FILE_WORKERS,
     DEFAULT_GB,
     DEFAULT_HOURS,
     DEFAULT_LICENSE_PLATE_RECOGNITION,
@@ -52,6 +55,7 @@ from viseron.components.storage.const import (
     DEFAULT_MOVE_ON_SHUTDOWN,
     DEFAULT_OBJECT_DETECTOR,
     DEFAULT_POLL,
+    DEFAULT_POLL_INTERVAL,
     DEFAULT_RECORDER,
     DEFAULT_RECORDER_TIERS,
     DEFAULT_SNAPSHOTS,
@@ -65,6 +69,7 @@ from viseron.components.storage.const import (
     DESC_DOMAIN_TIERS,
     DESC_EVENTS,
     DESC_FACE_RECOGNITION,
+    DESC_FILE_WORKERS,
     DESC_LICENSE_PLATE_RECOGNITION,
     DESC_MAX_AGE,
     DESC_MAX_DAYS,
@@ -85,6 +90,7 @@ from viseron.components.storage.const import (
     DESC_OBJECT_DETECTOR,
     DESC_PATH,
     DESC_POLL,
+    DESC_POLL_INTERVAL,
     DESC_RECORDER,
     DESC_RECORDER_TIERS,
     DESC_SNAPSHOTS,
@@ -197,6 +203,11 @@ TIER_SCHEMA_SNAPSHOTS = TIER_SCHEMA_BASE.extend(
             default=DEFAULT_POLL,
             description=DESC_POLL,
         ): bool,
+        vol.Optional(
+            CONFIG_POLL_INTERVAL,
+            default=DEFAULT_POLL_INTERVAL,
+            description=DESC_POLL_INTERVAL,
+        ): vol.All(int, vol.Range(min=1)),
         vol.Optional(
             CONFIG_MOVE_ON_SHUTDOWN,
             default=DEFAULT_MOVE_ON_SHUTDOWN,
@@ -245,6 +256,11 @@ TIER_SCHEMA_RECORDER = vol.Schema(
             default=DEFAULT_POLL,
             description=DESC_POLL,
         ): bool,
+        vol.Optional(
+            CONFIG_POLL_INTERVAL,
+            default=DEFAULT_POLL_INTERVAL,
+            description=DESC_POLL_INTERVAL,
+        ): vol.All(int, vol.Range(min=1)),
         vol.Optional(
             CONFIG_MOVE_ON_SHUTDOWN,
             default=DEFAULT_MOVE_ON_SHUTDOWN,
@@ -370,6 +386,11 @@ STORAGE_SCHEMA = vol.Schema(
                 }
             ),
         },
+        vol.Optional(
+            CONFIG_FILE_WORKERS,
+            default=DEFAULT_FILE_WORKERS,
+            description=DESC_FILE_WORKERS,
+        ): vol.All(int, vol.Range(min=1)),
     }
 )
 
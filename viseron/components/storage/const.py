@@ -7,11 +7,18 @@ COMPONENT = "storage"
 
 DATABASE_URL = "postgresql://postgres@localhost/viseron"
 
+# Number of rows fetched and handled at a time when checking tiers
+TIER_CHECK_CHUNK_SIZE: Final = 500
+# Max number of file system events written to the database in one transaction
+TIER_EVENT_BATCH_SIZE: Final = 50
+# Number of files unlinked per executor job. Smaller batches are unlinked serially
+UNLINK_CHUNK_SIZE: Final = 64
+
 EVENT_FILE_CREATED = (
     "file_created/{camera_identifier}/{category}/{subcategory}/{file_name}"
 )
-EVENT_FILE_DELETED = (
-    "file_deleted/{camera_identifier}/{category}/{subcategory}/{file_name}"
+EVENT_FILE_DELETED_BATCH = (
+    "file_deleted_batch/{camera_identifier}/{category}/{subcategory}"
 )
 
 # Storage configuration
@@ -19,6 +26,7 @@ DESC_COMPONENT = "Storage configuration."
 DEFAULT_COMPONENT: dict[str, Any] = {}
 CONFIG_PATH: Final = "path"
 CONFIG_POLL: Final = "poll"
+CONFIG_POLL_INTERVAL: Final = "poll_interval"
 CONFIG_MOVE_ON_SHUTDOWN: Final = "move_on_shutdown"
 CONFIG_CHECK_INTERVAL: Final = "check_interval"
 CONFIG_MIN_SIZE: Final = "min_size"
@@ -40,6 +48,7 @@ CONFIG_OBJECT_DETECTOR: Final = "object_detector"
 CONFIG_LICENSE_PLATE_RECOGNITION: Final = "license_plate_recognition"
 CONFIG_MOTION_DETECTOR: Final = "motion_detector"
 CONFIG_TIERS: Final = "tiers"
+CONFIG_FILE_WORKERS: Final = "file_workers"
 
 
 DEFAULT_RECORDER: dict[str, Any] = {}
@@ -66,8 +75,10 @@ DEFAULT_FACE_RECOGNITION: Final = None
 DEFAULT_OBJECT_DETECTOR: Final = None
 DEFAULT_LICENSE_PLATE_RECOGNITION: Final = None
 DEFAULT_MOTION_DETECTOR: Final = None
+DEFAULT_FILE_WORKERS: Final = 8
 
 DEFAULT_POLL = False
+DEFAULT_POLL_INTERVAL: Final = 1
 DEFAULT_MOVE_ON_SHUTDOWN = False
 DEFAULT_CHECK_INTERVAL: Final = None
 DEFAULT_CHECK_INTERVAL_DAYS: Final = 0
@@ -87,6 +98,9 @@ DEFAULT_CONTINUOUS: Final = None
 DEFAULT_EVENTS: Final = None
 
 DESC_RECORDER = "Configuration for recordings."
+DESC_FILE_WORKERS = (
+    "Number of threads used to move and delete files when they leave a tier."
+)
 DESC_TYPE = (
     "<code>continuous</code>: Will save everything but highlight Events.<br>"
     "<code>events</code>: Will only save Events.<br>"
@@ -144,6 +158,11 @@ DESC_POLL = (
     "Poll the file system for new files. "
     "Much slower than non-polling but required for some file systems like NTFS mounts."
 )
+DESC_POLL_INTERVAL = (
+    "Seconds between each scan of the file system when <code>poll</code> is enabled. "
+    "A higher value lowers the load on slow network mounts, at the cost of new files "
+    "being picked up later."
+)
 DESC_MOVE_ON_SHUTDOWN = (
     "Move/delete files to the next tier when Viseron shuts down. "
     "Useful to not lose files when shutting down Viseron if using a RAM disk."
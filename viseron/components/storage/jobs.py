@@ -40,6 +40,18 @@ LOGGER = logging.getLogger(__name__)
 BATCH_SIZE = 100
 
 
+def remove_file(path: str) -> bool:
+    """Remove a file and return True if it existed.
+
+    Avoids a separate os.path.exists call for every file that is removed.
+    """
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        return False
+    return True
+
+
 class BaseCleanupJob(ABC):
     """Base class for cleanup jobs."""
 
@@ -60,6 +72,17 @@ class BaseCleanupJob(ABC):
         except DomainNotRegisteredError:
             return None
 
+    def _get_camera_paths(self, camera: AbstractCamera) -> list[str]:
+        """Get the recordings, segments, thumbnails and snapshots paths of camera."""
+        return [
+            self._storage.get_recordings_path(camera),
+            self._storage.get_segments_path(camera),
+            self._storage.get_thumbnails_path(camera),
+        ] + [
+            self._storage.get_snapshots_path(camera, domain)
+            for domain in SnapshotDomain
+        ]
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -186,15 +209,7 @@ class OrphanedFilesCleanup(BaseCleanupJob):
 
         paths = []
         for camera in cameras.values():
-            paths += [
-                self._storage.get_recordings_path(camera),
-                self._storage.get_segments_path(camera),
-                self._storage.get_thumbnails_path(camera),
-            ] + [
-                self._storage.get_snapshots_path(camera, domain)
-                for camera in cameras.values()
-                for domain in SnapshotDomain
-            ]
+            paths += self._get_camera_paths(camera)
 
         total_files_processed = 0
         with self._storage.get_session() as session:
@@ -219,8 +234,7 @@ class OrphanedFilesCleanup(BaseCleanupJob):
                         file_exists = session.execute(
                             select(Files).where(Files.path == file_path)
                         ).first()
-                        if not file_exists and os.path.exists(file_path):
-                            os.remove(file_path)
+                        if not file_exists and remove_file(file_path):
                             LOGGER.debug("%s deleted %s", self.name, file_path)
                             deleted_count += 1
                         self.log_progress(
@@ -338,14 +352,7 @@ class EmptyFoldersCleanup(BaseCleanupJob):
             return
 
         for camera in cameras.values():
-            for path in [
-                self._storage.get_recordings_path(camera),
-                self._storage.get_segments_path(camera),
-                self._storage.get_thumbnails_path(camera),
-            ] + [
-                self._storage.get_snapshots_path(camera, domain)
-                for domain in SnapshotDomain
-            ]:
+            for path in self._get_camera_paths(camera):
                 time.sleep(1)
                 for root, dirs, files in os.walk(path, topdown=False):
                     processed_count += 1
@@ -418,10 +425,9 @@ class OrphanedThumbnailsCleanup(BaseCleanupJob):
 
                     # Delete files that don't exist in database
                     for file_path in batch:
-                        if file_path not in existing_thumbnails and os.path.exists(
+                        if file_path not in existing_thumbnails and remove_file(
                             file_path
                         ):
-                            os.remove(file_path)
                             deleted_count += 1
                         total_files_processed += 1
                         files_processed += 1
@@ -499,10 +505,7 @@ class OrphanedClipsCleanup(BaseCleanupJob):
 
                     # Delete files that don't exist in database
                     for file_path in batch:
-                        if file_path not in existing_clips and os.path.exists(
-                            file_path
-                        ):
-                            os.remove(file_path)
+                        if file_path not in existing_clips and remove_file(file_path):
                             deleted_count += 1
                         total_files_processed += 1
                         files_processed += 1
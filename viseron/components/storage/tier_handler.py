@@ -1,16 +1,32 @@
 """Tier handler."""
 from __future__ import annotations
 
+import errno
 import logging
 import os
 import shutil
-from collections.abc import Callable
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import Executor
 from datetime import datetime, timedelta
-from queue import Queue
-from threading import Lock, Timer
+from functools import lru_cache
+from itertools import islice
+from operator import attrgetter
+from threading import Event, Lock
 from typing import TYPE_CHECKING, Any, Literal
 
-from sqlalchemy import Delete, Result, delete, insert, select, update
+from sqlalchemy import (
+    Delete,
+    Result,
+    Row,
+    bindparam,
+    delete,
+    insert,
+    literal,
+    select,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import IntegrityError, NoResultFound
 from sqlalchemy.orm import Session
 from sqlalchemy.sql.dml import ReturningDelete
@@ -21,8 +37,6 @@ from watchdog.events import (
     FileSystemEvent,
     FileSystemEventHandler,
 )
-from watchdog.observers import Observer
-from watchdog.observers.polling import PollingObserverVFS
 
 from viseron.components.storage.const import (
     COMPONENT,
@@ -39,9 +53,12 @@ from viseron.components.storage.const import (
     CONFIG_MOVE_ON_SHUTDOWN,
     CONFIG_PATH,
     CONFIG_POLL,
+    CONFIG_POLL_INTERVAL,
     CONFIG_SECONDS,
     EVENT_FILE_CREATED,
-    EVENT_FILE_DELETED,
+    EVENT_FILE_DELETED_BATCH,
+    TIER_CHECK_CHUNK_SIZE,
+    TIER_EVENT_BATCH_SIZE,
 )
 from viseron.components.storage.models import (
     Files,
@@ -58,7 +75,8 @@ from viseron.components.storage.queries import (
 )
 from viseron.components.storage.util import (
     EventFileCreated,
-    EventFileDeleted,
+    EventFileDeletedBatch,
+    batch_unlink,
     calculate_age,
     calculate_bytes,
     files_to_move_overlap,
@@ -77,6 +95,10 @@ if TYPE_CHECKING:
     from viseron.components.webserver import Webserver
     from viseron.domains.camera import AbstractCamera
 
+# File system events that tier handlers act on. Watchdog interleaves these with
+# directory, opened and closed events, which are dropped before being queued
+QUEUED_EVENT_TYPES = frozenset({FileCreatedEvent, FileModifiedEvent, FileDeletedEvent})
+
 
 class TierHandler(FileSystemEventHandler):
     """Moves files up configured tiers."""
@@ -104,13 +126,18 @@ class TierHandler(FileSystemEventHandler):
         self._category = category
         self._subcategory = subcategory
         self._tier = tier
+        self._tier_path: str = tier[CONFIG_PATH]
         self._next_tier = next_tier
 
         self.initialize()
         vis.register_signal_handler(VISERON_SIGNAL_LAST_WRITE, self._shutdown)
 
-        self._pending_updates: dict[str, Timer] = {}
-        self._event_queue: Queue[FileSystemEvent | None] = Queue()
+        self._event_deque: deque[tuple[FileSystemEvent, str]] = deque()
+        self._event_ready = Event()
+        # Set by _update_sizes, which runs on the shared debouncer thread, so that
+        # the tier check runs on this handler's own event thread instead
+        self._check_tier_requested = False
+        self._stopping = False
         self._event_thread = RestartableThread(
             target=self._process_events,
             daemon=True,
@@ -130,17 +157,14 @@ class TierHandler(FileSystemEventHandler):
 
         self._logger.debug("Tier %s monitoring path: %s", tier_id, self._path)
         os.makedirs(self._path, exist_ok=True)
-        self._observer = (
-            PollingObserverVFS(stat=os.stat, listdir=os.scandir, polling_interval=1)
-            if tier[CONFIG_POLL]
-            else Observer()
+        self._observer = self._storage.get_observer(
+            tier[CONFIG_POLL_INTERVAL] if tier[CONFIG_POLL] else None
         )
-        self._observer.schedule(
+        self._watch = self._observer.schedule(
             self,
             self._path,
             recursive=True,
         )
-        self._observer.start()
 
     @property
     def tier(self) -> dict[str, Any]:
@@ -211,61 +235,126 @@ class TierHandler(FileSystemEventHandler):
             )
 
             if file_ids is not None:
-                for file in file_ids:
-                    handle_file(
+                for chunk in chunked(file_ids, TIER_CHECK_CHUNK_SIZE):
+                    handle_files(
                         get_session,
                         self._storage,
                         self._camera.identifier,
                         self._tier,
                         self._next_tier,
-                        file.path,
-                        file.tier_path,
+                        [(file.path, file.tier_path) for file in chunk],
                         self._logger,
                     )
             session.commit()
 
     def _process_events(self) -> None:
         while True:
-            event = self._event_queue.get()
-            if event is None:
+            self._event_ready.wait()
+            self._event_ready.clear()
+            while self._event_deque:
+                self._process_event_batch()
+            if self._check_tier_requested:
+                self._check_tier_requested = False
+                self.check_tier()
+            if self._stopping:
                 self._logger.debug("Stopping event handler")
                 break
-            if isinstance(event, FileDeletedEvent):
-                self._on_deleted(event)
-            elif isinstance(event, FileCreatedEvent):
-                self._on_created(event)
-            elif isinstance(event, FileModifiedEvent):
+
+    def _process_event_batch(self) -> None:
+        """Handle up to TIER_EVENT_BATCH_SIZE queued events.
+
+        Created and deleted events are collected so that each type is written to
+        the database in a single transaction. Watchdog interleaves them with
+        modified events, which are debounced and therefore do not split the
+        batch. The collected events are only flushed early if a path is both
+        created and deleted, to keep the order of events for that path.
+        """
+        batch: list[tuple[FileSystemEvent, str]] = []
+        while self._event_deque and len(batch) < TIER_EVENT_BATCH_SIZE:
+            batch.append(self._event_deque.popleft())
+
+        groups: dict[type[FileSystemEvent], list[tuple[FileSystemEvent, str]]] = {
+            FileCreatedEvent: [],
+            FileDeletedEvent: [],
+        }
+        path_types: dict[str, type[FileSystemEvent]] = {}
+        for item in batch:
+            event = item[0]
+            event_type = type(event)
+            if event_type is FileModifiedEvent:
                 self._on_modified(event)
+                continue
+            if path_types.setdefault(event.src_path, event_type) is not event_type:
+                self._flush_event_groups(groups)
+                groups = {FileCreatedEvent: [], FileDeletedEvent: []}
+                path_types = {event.src_path: event_type}
+            groups[event_type].append(item)
+        self._flush_event_groups(groups)
+
+    def _flush_event_groups(
+        self,
+        groups: dict[type[FileSystemEvent], list[tuple[FileSystemEvent, str]]],
+    ) -> None:
+        """Write grouped created and deleted events to the database."""
+        if groups[FileCreatedEvent]:
+            self._on_created(groups[FileCreatedEvent])
+        if groups[FileDeletedEvent]:
+            self._on_deleted(groups[FileDeletedEvent])
 
     def on_any_event(self, event: FileSystemEvent) -> None:
         """Handle file system events."""
-        if os.path.basename(event.src_path) in self._storage.ignored_files:
+        if type(event) not in QUEUED_EVENT_TYPES:
+            return
+        file_name = event.src_path.rpartition("/")[2]
+        if file_name in self._storage.ignored_files:
+            return
+        self._event_deque.append((event, file_name))
+        self._event_ready.set()
+
+    def _on_created(self, events: list[tuple[FileSystemEvent, str]]) -> None:
+        """Insert into database when files are created."""
+        # Keyed by path to drop duplicate events for the same file in a burst
+        rows: dict[str, dict[str, Any]] = {}
+        for event, file_name in events:
+            if event.src_path in rows:
+                continue
+            self._logger.debug("File created: %s", event.src_path)
+            try:
+                size = os.stat(event.src_path, follow_symlinks=False).st_size
+            except FileNotFoundError:
+                self._logger.debug("File not found: %s", event.src_path)
+                continue
+            rows[event.src_path] = {
+                "tier_id": self._tier_id,
+                "tier_path": self._tier_path,
+                "camera_identifier": self._camera.identifier,
+                "category": self._category,
+                "subcategory": self._subcategory,
+                "path": event.src_path,
+                "directory": event.src_path.rpartition("/")[0],
+                "filename": file_name,
+                "size": size,
+            }
+        if not rows:
             return
-        self._event_queue.put(event)
 
-    def _on_created(self, event: FileCreatedEvent) -> None:
-        """Insert into database when file is created."""
-        self._logger.debug("File created: %s", event.src_path)
-        try:
-            with self._storage.get_session() as session:
-                stmt = insert(Files).values(
-                    tier_id=self._tier_id,
-                    tier_path=self._tier[CONFIG_PATH],
-                    camera_identifier=self._camera.identifier,
-                    category=self._category,
-                    subcategory=self._subcategory,
-                    path=event.src_path,
-                    directory=os.path.dirname(event.src_path),
-                    filename=os.path.basename(event.src_path),
-                    size=os.path.getsize(event.src_path),
-                )
-                session.execute(stmt)
-                session.commit()
-        except IntegrityError:
-            self._logger.error(
-                "Failed to insert file %s into database, already exists", event.src_path
+        with self._storage.get_session() as session:
+            stmt = (
+                pg_insert(Files)
+                .values(list(rows.values()))
+                .on_conflict_do_nothing(index_elements=["path"])
+                .returning(Files.path)
             )
-        else:
+            inserted = set(session.execute(stmt).scalars())
+            session.commit()
+
+        for row in rows.values():
+            if row["path"] not in inserted:
+                self._logger.error(
+                    "Failed to insert file %s into database, already exists",
+                    row["path"],
+                )
+                continue
             self._vis.dispatch_event(
                 EVENT_FILE_CREATED.format(
                     camera_identifier=self._camera.identifier,
@@ -277,66 +366,69 @@ class TierHandler(FileSystemEventHandler):
                     camera_identifier=self._camera.identifier,
                     category=self._category,
                     subcategory=self._subcategory,
-                    file_name=os.path.basename(event.src_path),
-                    path=event.src_path,
+                    file_name=row["filename"],
+                    path=row["path"],
                 ),
             )
 
         self.check_tier()
 
-    def _on_modified(self, event: FileModifiedEvent) -> None:
-        """Update database when file is moved."""
-
-        def _update_size() -> None:
-            """Update the size of a file in the database.
-
-            Runs in a Timer to avoid spamming updates on duplicate events.
-            """
-            self._logger.debug("File modified (delayed event): %s", event.src_path)
-            self._pending_updates.pop(event.src_path, None)
+    def _update_sizes(self, paths: list[str]) -> None:
+        """Update the size of files in the database using a single statement."""
+        sizes = []
+        for path in paths:
+            self._logger.debug("File modified (delayed event): %s", path)
             try:
-                size = os.path.getsize(event.src_path)
+                sizes.append({"b_path": path, "b_size": os.path.getsize(path)})
             except FileNotFoundError:
-                self._logger.debug("File not found: %s", event.src_path)
-                return
+                self._logger.debug("File not found: %s", path)
+        if not sizes:
+            return
 
-            with self._storage.get_session() as session:
-                stmt = (
-                    update(Files).where(Files.path == event.src_path).values(size=size)
-                )
-                session.execute(stmt)
-                session.commit()
+        with self._storage.get_session() as session:
+            stmt = (
+                update(Files)
+                .where(Files.path == bindparam("b_path"))
+                .values(size=bindparam("b_size"))
+            )
+            session.connection().execute(stmt, sizes)
+            session.commit()
+
+        self._check_tier_requested = True
+        self._event_ready.set()
 
-            self.check_tier()
+    def _on_modified(self, event: FileSystemEvent) -> None:
+        """Update database when file is modified.
 
-        if event.src_path in self._pending_updates:
-            self._pending_updates[event.src_path].cancel()
-        self._pending_updates[event.src_path] = Timer(1, _update_size)
-        self._pending_updates[event.src_path].start()
+        Updates are debounced to avoid spamming the database on duplicate events.
+        """
+        self._storage.debouncer.schedule(event.src_path, self._update_sizes)
 
-    def _on_deleted(self, event: FileDeletedEvent) -> None:
-        """Remove file from database when it is deleted."""
-        self._logger.debug("File deleted: %s", event.src_path)
+    def _on_deleted(self, events: list[tuple[FileSystemEvent, str]]) -> None:
+        """Remove files from database when they are deleted."""
+        # dict.fromkeys drops duplicate events for the same file while keeping the
+        # order
+        paths = list(dict.fromkeys(event.src_path for event, _ in events))
+        for path in paths:
+            self._logger.debug("File deleted: %s", path)
         with self._storage.get_session() as session:
-            stmt = delete(Files).where(Files.path == event.src_path)
+            stmt = delete(Files).where(Files.path.in_(paths))
             session.execute(stmt)
-            stmt = delete(FilesMeta).where(FilesMeta.path == event.src_path)
+            stmt = delete(FilesMeta).where(FilesMeta.path.in_(paths))
             session.execute(stmt)
             session.commit()
 
         self._vis.dispatch_event(
-            EVENT_FILE_DELETED.format(
+            EVENT_FILE_DELETED_BATCH.format(
                 camera_identifier=self._camera.identifier,
                 category=self._category,
                 subcategory=self._subcategory,
-                file_name=os.path.basename(event.src_path),
             ),
-            EventFileDeleted(
+            EventFileDeletedBatch(
                 camera_identifier=self._camera.identifier,
                 category=self._category,
                 subcategory=self._subcategory,
-                file_name=os.path.basename(event.src_path),
-                path=event.src_path,
+                paths=tuple(paths),
             ),
         )
 
@@ -356,12 +448,11 @@ class TierHandler(FileSystemEventHandler):
                 self._next_tier,
                 self._logger,
             )
-        for pending_update in self._pending_updates.copy().values():
-            pending_update.join()
-        self._event_queue.put(None)
+        self._stopping = True
+        self._event_ready.set()
         self._event_thread.join()
-        self._observer.stop()
-        self._observer.join()
+        self._storage.debouncer.flush(self._update_sizes)
+        self._observer.unschedule(self._watch)
 
 
 class SegmentsTierHandler(TierHandler):
@@ -452,7 +543,7 @@ class SegmentsTierHandler(TierHandler):
             )
         return []
 
-    def _get_continuous_file_ids(self, session: Session) -> Result[Any] | list:
+    def _get_continuous_file_ids(self, session: Session) -> Sequence[Row[Any]]:
         if self._continuous_enabled:
             return get_files_to_move(
                 session,
@@ -476,7 +567,7 @@ class SegmentsTierHandler(TierHandler):
 
             # A file can be in multiple recordings, so we need to keep track of which
             # files we have already processed using processed_paths
-            processed_paths = []
+            processed_paths: set[str] = set()
             events_next_tier = None
             continuous_next_tier = None
             if self._events_enabled and not self._continuous_enabled:
@@ -498,30 +589,32 @@ class SegmentsTierHandler(TierHandler):
                         self._logger,
                         force_delete,
                     )
-                    processed_paths.append(file.path)
+                    processed_paths.add(file.path)
             elif self._continuous_enabled and not self._events_enabled:
                 continuous_next_tier = find_next_tier_segments(
                     self._storage, self._tier_id, self._camera, "continuous"
                 )
-                for file in continuous_file_ids:
-                    handle_file(
+                for chunk in chunked(continuous_file_ids, TIER_CHECK_CHUNK_SIZE):
+                    handle_files(
                         get_session,
                         self._storage,
                         self._camera.identifier,
                         self._tier,
                         continuous_next_tier.tier if continuous_next_tier else None,
-                        file.path,
-                        file.tier_path,
+                        [(file.path, file.tier_path) for file in chunk],
                         self._logger,
                     )
             else:
-                overlap = files_to_move_overlap(events_file_ids, continuous_file_ids)
+                overlap = files_to_move_overlap(
+                    events_file_ids, set(map(attrgetter("id"), continuous_file_ids))
+                )
                 events_next_tier = find_next_tier_segments(
                     self._storage, self._tier_id, self._camera, "events"
                 )
                 continuous_next_tier = find_next_tier_segments(
                     self._storage, self._tier_id, self._camera, "continuous"
                 )
+                seen_dirs: set[str] = set()
                 for file in overlap:
                     if file.path in processed_paths:
                         continue
@@ -558,56 +651,49 @@ class SegmentsTierHandler(TierHandler):
                         file.tier_path,
                         self._logger,
                         force_delete=force_delete,
+                        seen_dirs=seen_dirs,
                     )
-                    processed_paths.append(file.path)
+                    processed_paths.add(file.path)
 
-            recording_ids: list[int] = []
-            for recording in events_file_ids:
-                if (
+            # dict.fromkeys removes duplicates while keeping the order
+            recording_ids: list[int] = list(
+                dict.fromkeys(
                     recording.recording_id
-                    and recording.recording_id not in recording_ids
-                ):
-                    recording_ids.append(recording.recording_id)
-
-            # Signal to the thumbnail tier that the recording has been moved
-            if recording_ids:
-                self._logger.debug(
-                    "Handle thumbnails for recordings: %s", recording_ids
+                    for recording in events_file_ids
+                    if recording.recording_id
                 )
-                for recording_id in recording_ids:
-                    thumbnail_tier_handler: ThumbnailTierHandler = (
-                        self._storage.camera_tier_handlers[self._camera.identifier][
-                            self._category
-                        ][self._tier_id]["thumbnails"]
-                    )
-                    thumbnail_tier_handler.move_thumbnail(
-                        recording_id,
-                        events_next_tier.tier if events_next_tier else None,
-                    )
+            )
 
-            # Signal to the recordings tier that the recording has been moved
+            # Signal to the thumbnail and recordings tiers that the recording has
+            # been moved
             if recording_ids:
                 self._logger.debug(
-                    "Handle event clip for recordings: %s", recording_ids
+                    "Handle thumbnails and event clips for recordings: %s",
+                    recording_ids,
                 )
+                tier_handlers = self._storage.camera_tier_handlers[
+                    self._camera.identifier
+                ][self._category][self._tier_id]
+                thumbnail_tier_handler: ThumbnailTierHandler = tier_handlers[
+                    "thumbnails"
+                ]
+                recordings_tier_handler: RecordingsTierHandler = tier_handlers[
+                    "recordings"
+                ]
+                next_tier_config = events_next_tier.tier if events_next_tier else None
                 for recording_id in recording_ids:
-                    recordings_tier_handler: RecordingsTierHandler = (
-                        self._storage.camera_tier_handlers[self._camera.identifier][
-                            self._category
-                        ][self._tier_id]["recordings"]
+                    thumbnail_tier_handler.move_thumbnail(
+                        recording_id, next_tier_config
                     )
                     recordings_tier_handler.move_event_clip(
-                        recording_id,
-                        events_next_tier.tier if events_next_tier else None,
+                        recording_id, next_tier_config
                     )
 
             # Delete recordings from Recordings table if this is the last tier
             if recording_ids and events_next_tier is None:
                 self._logger.debug("Deleting recordings: %s", recording_ids)
-                with get_session() as _session:
-                    stmt = delete(Recordings).where(Recordings.id.in_(recording_ids))
-                    _session.execute(stmt)
-                    _session.commit()
+                stmt = delete(Recordings).where(Recordings.id.in_(recording_ids))
+                session.execute(stmt)
 
             session.commit()
 
@@ -620,13 +706,14 @@ class SnapshotTierHandler(TierHandler):
         super().initialize()
         self.add_file_handler(self._path, rf"{self._path}/(.*.jpg$)")
 
-    def _on_deleted(self, event: FileDeletedEvent) -> None:
+    def _on_deleted(self, events: list[tuple[FileSystemEvent, str]]) -> None:
         stmt: Delete | ReturningDelete[tuple[int]]
+        paths = [event.src_path for event, _ in events]
         if self._subcategory == "motion_detector":
             with self._storage.get_session() as session:
                 stmt = (
                     delete(Motion)
-                    .where(Motion.snapshot_path == event.src_path)
+                    .where(Motion.snapshot_path.in_(paths))
                     .returning(Motion.id)
                 )
                 result = session.execute(stmt)
@@ -642,19 +729,19 @@ class SnapshotTierHandler(TierHandler):
 
         elif self._subcategory == "object_detector":
             with self._storage.get_session() as session:
-                stmt = delete(Objects).where(Objects.snapshot_path == event.src_path)
+                stmt = delete(Objects).where(Objects.snapshot_path.in_(paths))
                 session.execute(stmt)
                 session.commit()
 
         elif self._subcategory in ["face_recognition", "license_plate_recognition"]:
             with self._storage.get_session() as session:
                 stmt = delete(PostProcessorResults).where(
-                    PostProcessorResults.snapshot_path == event.src_path
+                    PostProcessorResults.snapshot_path.in_(paths)
                 )
                 session.execute(stmt)
                 session.commit()
 
-        super()._on_deleted(event)
+        super()._on_deleted(events)
 
 
 class ThumbnailTierHandler(TierHandler):
@@ -673,24 +760,25 @@ class ThumbnailTierHandler(TierHandler):
     def check_tier(self) -> None:
         """Do nothing, as we don't want to move thumbnails."""
 
-    def _on_created(self, event: FileCreatedEvent) -> None:
-        try:
-            with self._storage.get_session() as session:
-                stmt = (
-                    update(Recordings)
-                    .where(
-                        Recordings.id == os.path.basename(event.src_path).split(".")[0]
+    def _on_created(self, events: list[tuple[FileSystemEvent, str]]) -> None:
+        with self._storage.get_session() as session:
+            for event, file_name in events:
+                # Use a savepoint so that one failing update does not affect the rest
+                try:
+                    with session.begin_nested():
+                        stmt = (
+                            update(Recordings)
+                            .where(Recordings.id == file_name.partition(".")[0])
+                            .values(thumbnail_path=event.src_path)
+                        )
+                        session.execute(stmt)
+                except Exception as error:  # pylint: disable=broad-except
+                    self._logger.error(
+                        "Failed to update thumbnail path for recording with path: "
+                        f"{event.src_path}: {error}"
                     )
-                    .values(thumbnail_path=event.src_path)
-                )
-                session.execute(stmt)
-                session.commit()
-        except Exception as error:  # pylint: disable=broad-except
-            self._logger.error(
-                "Failed to update thumbnail path for recording with path: "
-                f"{event.src_path}: {error}"
-            )
-        super()._on_created(event)
+            session.commit()
+        super()._on_created(events)
 
     def move_thumbnail(
         self, recording_id: int, next_tier: dict[str, Any] | None
@@ -715,7 +803,7 @@ class ThumbnailTierHandler(TierHandler):
                 self._tier,
                 next_tier,
                 recording.thumbnail_path,
-                self._tier[CONFIG_PATH],
+                self._tier_path,
                 self._logger,
             )
             session.commit()
@@ -726,11 +814,7 @@ class RecordingsTierHandler(TierHandler):
 
     def initialize(self):
         """Initialize recordings tier."""
-        self._path = os.path.join(
-            self._tier[CONFIG_PATH],
-            "recordings",
-            self._camera.identifier,
-        )
+        self._path = get_recorder_path(self._tier, self._camera, self._subcategory)
         self.add_file_handler(
             self._path, rf"{self._path}/(.*.{self._camera.identifier}$)"
         )
@@ -738,21 +822,53 @@ class RecordingsTierHandler(TierHandler):
     def check_tier(self) -> None:
         """Do nothing, as we move recordings manually."""
 
-    def _update_clip_path(self, event: FileCreatedEvent) -> None:
+    def _clip_path_candidates(self, path: str) -> list[str]:
+        """Return the paths a clip could have been moved to path from."""
+        relative_path = path[len(self._path) :]
+        candidates = []
+        for tier_handlers in self._storage.camera_tier_handlers[
+            self._camera.identifier
+        ][self._category]:
+            tier_handler = tier_handlers[self._subcategory]
+            if tier_handler is self:
+                continue
+            candidates.append(
+                get_recorder_path(tier_handler.tier, self._camera, self._subcategory)
+                + relative_path
+            )
+        return candidates
+
+    def _update_clip_path(self, event: FileSystemEvent) -> None:
         try:
             with self._storage.get_session() as session:
+                # Look up the clip by its path in the other tiers, which can use the
+                # index on clip_path
                 stmt = (
                     update(Recordings)
                     .where(Recordings.camera_identifier == self._camera.identifier)
                     .where(
-                        Recordings.clip_path.like(
-                            f"%{event.src_path.split('/')[-2]}/"
-                            f"{os.path.basename(event.src_path)}"
+                        Recordings.clip_path.in_(
+                            self._clip_path_candidates(event.src_path)
                         )
                     )
                     .values(clip_path=event.src_path)
                 )
-                session.execute(stmt)
+                result = session.execute(stmt)
+                # Fall back to matching on the end of the path, in case the clip was
+                # moved from a tier that is no longer configured
+                if result.rowcount == 0:
+                    stmt = (
+                        update(Recordings)
+                        .where(Recordings.camera_identifier == self._camera.identifier)
+                        .where(
+                            Recordings.clip_path.like(
+                                f"%{event.src_path.split('/')[-2]}/"
+                                f"{os.path.basename(event.src_path)}"
+                            )
+                        )
+                        .values(clip_path=event.src_path)
+                    )
+                    session.execute(stmt)
                 session.commit()
         except Exception as error:  # pylint: disable=broad-except
             self._logger.error(
@@ -760,10 +876,11 @@ class RecordingsTierHandler(TierHandler):
                 f"{event.src_path}: {error}"
             )
 
-    def _on_created(self, event: FileCreatedEvent) -> None:
+    def _on_created(self, events: list[tuple[FileSystemEvent, str]]) -> None:
         if not self.first_tier:
-            self._update_clip_path(event)
-        super()._on_created(event)
+            for event, _ in events:
+                self._update_clip_path(event)
+        super()._on_created(events)
 
     def move_event_clip(
         self, recording_id: int, next_tier: dict[str, Any] | None
@@ -786,12 +903,19 @@ class RecordingsTierHandler(TierHandler):
                 self._tier,
                 next_tier,
                 recording.clip_path,
-                self._tier[CONFIG_PATH],
+                self._tier_path,
                 self._logger,
             )
             session.commit()
 
 
+def chunked(rows: Iterable[Any], size: int) -> Iterator[list[Any]]:
+    """Yield lists of at most size rows."""
+    iterator = iter(rows)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
 def find_next_tier_segments(
     storage: Storage,
     tier_id: int,
@@ -823,14 +947,19 @@ def handle_file(
     tier_path: str,
     logger: logging.Logger,
     force_delete: bool = False,
+    seen_dirs: set[str] | None = None,
 ) -> None:
-    """Move file if there is a succeeding tier, else delete the file."""
+    """Move file if there is a succeeding tier, else delete the file.
+
+    seen_dirs is passed on to move_file, see its docstring.
+    """
     if path in storage.camera_requested_files_count[camera_identifier].filenames:
         logger.debug("File %s is recently requested, skipping", path)
         return
 
+    row_deleted = False
     if force_delete or next_tier is None:
-        delete_file(get_session, path, logger)
+        row_deleted = delete_file(get_session, path, logger)
     else:
         new_path = path.replace(tier_path, next_tier[CONFIG_PATH], 1)
         if new_path == path:
@@ -841,18 +970,20 @@ def handle_file(
                 path,
             )
         else:
-            move_file(
+            row_deleted = move_file(
                 get_session,
                 path,
                 new_path,
                 logger,
+                seen_dirs=seen_dirs,
             )
 
     # Delete the file from the database if tier_path is not the same as
     # curr_tier[CONFIG_PATH]. This is an indication that the tier configuration
     # has changed and since the old path is not monitored, the delete signal
-    # will not be received by Viseron
-    if tier_path != curr_tier[CONFIG_PATH]:
+    # will not be received by Viseron.
+    # Skipped if the row was already deleted above
+    if tier_path != curr_tier[CONFIG_PATH] and not row_deleted:
         logger.debug(
             "Deleting file %s from database since tier paths are different. "
             "file tier_path: %s, current tier_path: %s",
@@ -868,46 +999,270 @@ def handle_file(
             session.commit()
 
 
+def handle_files(
+    get_session: Callable[..., Session],
+    storage: Storage,
+    camera_identifier: str,
+    curr_tier: dict[str, Any],
+    next_tier: dict[str, Any] | None,
+    files: list[tuple[str, str]],
+    logger: logging.Logger,
+    force_delete: bool = False,
+) -> None:
+    """Move files if there is a succeeding tier, else delete the files.
+
+    Works like handle_file for a list of (path, tier_path) tuples, but the files
+    that are moved are handled in bulk by bulk_move_files.
+    """
+    requested_filenames = storage.camera_requested_files_count[
+        camera_identifier
+    ].filenames
+    curr_tier_path = curr_tier[CONFIG_PATH]
+    next_tier_path = (
+        None if force_delete or next_tier is None else next_tier[CONFIG_PATH]
+    )
+    deletes: list[str] = []
+    moves: list[tuple[str, str]] = []
+    stale_paths: list[str] = []
+    for path, tier_path in files:
+        if path in requested_filenames:
+            logger.debug("File %s is recently requested, skipping", path)
+            continue
+
+        if next_tier_path is None:
+            deletes.append(path)
+            continue
+
+        new_path = path.replace(tier_path, next_tier_path, 1)
+        if new_path == path:
+            logger.warning(
+                "Failed to move file %s to next tier, new path is the same as "
+                "old. Viseron tries to mitigate this, but it can happen if you "
+                "recently changed the tier paths or a previous move failed.",
+                path,
+            )
+            # See handle_file. Deleted and moved files have their rows removed
+            # by bulk_delete_files and bulk_move_files already
+            if tier_path != curr_tier_path:
+                stale_paths.append(path)
+        else:
+            moves.append((path, new_path))
+
+    if deletes:
+        bulk_delete_files(get_session, deletes, logger, storage.file_executor)
+
+    if moves:
+        bulk_move_files(get_session, moves, logger, storage.file_executor)
+
+    if stale_paths:
+        logger.debug(
+            "Deleting files %s from database since tier paths are different. "
+            "current tier_path: %s",
+            stale_paths,
+            curr_tier_path,
+        )
+        with get_session() as session:
+            stmt = delete(Files).where(Files.path.in_(stale_paths))
+            session.execute(stmt)
+            stmt = delete(FilesMeta).where(FilesMeta.path.in_(stale_paths))
+            session.execute(stmt)
+            session.commit()
+
+
+def bulk_move_files(
+    get_session: Callable[..., Session],
+    files: list[tuple[str, str]],
+    logger: logging.Logger,
+    executor: Executor | None = None,
+) -> None:
+    """Move a list of files from src to dst.
+
+    Works like move_file, but the metadata of all files is fetched, copied and
+    deleted using one statement each instead of a handful of statements per file.
+    If an executor is given, the files themselves are moved concurrently using it.
+    """
+    logger.debug("Moving files: %s", files)
+    srcs = [src for src, _ in files]
+    with get_session() as session:
+        sel = select(FilesMeta.path, FilesMeta.meta, FilesMeta.orig_ctime).where(
+            FilesMeta.path.in_(srcs)
+        )
+        files_meta = {row.path: row for row in session.execute(sel)}
+        values = [
+            {
+                "path": dst,
+                "meta": files_meta[src].meta,
+                "orig_ctime": files_meta[src].orig_ctime,
+            }
+            for src, dst in files
+            if src in files_meta
+        ]
+        if values:
+            # Metadata that already exists for dst is kept, like in move_file
+            session.execute(
+                pg_insert(FilesMeta).on_conflict_do_nothing(index_elements=["path"]),
+                values,
+            )
+        missing_meta = [src for src in srcs if src not in files_meta]
+        if missing_meta:
+            logger.debug("Failed to find metadata for %s", missing_meta)
+            stmt = delete(Files).where(Files.path.in_(missing_meta))
+            session.execute(stmt)
+        session.commit()
+
+    for src in missing_meta:
+        try:
+            os.remove(src)
+        except FileNotFoundError as error:
+            logger.debug(f"Failed to delete file {src}: {error}")
+
+    seen_dirs: set[str] = set()
+
+    def _move(src: str, dst: str) -> bool:
+        """Move a file and return False if it is still left at src."""
+        try:
+            _makedirs_cached(os.path.dirname(dst), seen_dirs)
+            _relocate_file(src, dst)
+        except FileNotFoundError as error:
+            logger.debug(f"Failed to move file {src} to {dst}: {error}")
+        except OSError as error:
+            logger.error(f"Failed to move file {src} to {dst}: {error}")
+            return False
+        return True
+
+    move_srcs = [src for src, _ in files if src in files_meta]
+    dsts = [dst for src, dst in files if src in files_meta]
+    if executor:
+        # Overlap the IO of several files, the database is only touched below
+        results = list(executor.map(_move, move_srcs, dsts))
+    else:
+        results = list(map(_move, move_srcs, dsts))
+
+    # Clean up the old paths in one go instead of waiting for the delete event of
+    # each file. Files that no longer exist are removed as well, like in move_file,
+    # but files that failed to move for any other reason are kept
+    moved_paths = [src for src, moved in zip(move_srcs, results) if moved]
+    if moved_paths:
+        with get_session() as session:
+            stmt = delete(Files).where(Files.path.in_(moved_paths))
+            session.execute(stmt)
+            stmt = delete(FilesMeta).where(FilesMeta.path.in_(moved_paths))
+            session.execute(stmt)
+            session.commit()
+
+
+def _makedirs_cached(directory: str, seen_dirs: set[str]) -> None:
+    """Create directory unless it is already in seen_dirs."""
+    if directory not in seen_dirs:
+        os.makedirs(directory, exist_ok=True)
+        seen_dirs.add(directory)
+
+
+def _fast_copy(src: str, dst: str) -> None:
+    """Copy the contents of src to dst without copying any file metadata.
+
+    Uses os.copy_file_range where available so that the data is copied by the
+    kernel, and falls back to shutil.copyfile otherwise. Some filesystems report
+    0 bytes copied instead of raising, so shutil.copyfile is also used if the
+    copy came up short.
+    """
+    try:
+        with open(src, "rb") as src_file, open(dst, "wb") as dst_file:
+            remaining = os.fstat(src_file.fileno()).st_size
+            while remaining > 0:
+                copied = os.copy_file_range(
+                    src_file.fileno(), dst_file.fileno(), remaining
+                )
+                if copied == 0:
+                    break
+                remaining -= copied
+        if remaining == 0:
+            return
+    except FileNotFoundError:
+        raise
+    except (AttributeError, OSError):
+        pass
+    shutil.copyfile(src, dst)
+
+
+@lru_cache(maxsize=256)
+def _same_device(src_dir: str, dst_dir: str) -> bool:
+    """Return True if src_dir and dst_dir are on the same filesystem."""
+    return os.stat(src_dir).st_dev == os.stat(dst_dir).st_dev
+
+
+def _relocate_file(src: str, dst: str) -> None:
+    """Move the file data from src to dst.
+
+    Uses os.rename when both paths are on the same filesystem, which is atomic
+    and does not copy any data. Otherwise the file is copied and then removed.
+    """
+    if _same_device(os.path.dirname(src), os.path.dirname(dst)):
+        try:
+            os.rename(src, dst)
+            return
+        except OSError as error:
+            # Filesystems might have been remounted since the check was cached
+            if error.errno != errno.EXDEV:
+                raise
+            _same_device.cache_clear()
+    _fast_copy(src, dst)
+    os.remove(src)
+
+
 def move_file(
     get_session: Callable[..., Session],
     src: str,
     dst: str,
     logger: logging.Logger,
-) -> None:
+    seen_dirs: set[str] | None = None,
+) -> bool:
     """Move file from src to dst.
 
     To avoid race conditions where a file is referenced at the same time as it is being
     moved, causing a 404 in the browser, we copy the file to the new location and then
-    delete the old one.
+    delete the old one. If src and dst are on the same filesystem the file is renamed
+    instead, which is atomic.
+
+    seen_dirs can be shared between calls to skip creating destination directories
+    that have already been created.
+
+    Returns True if the database row of src was deleted. Otherwise it is deleted
+    when the delete event for src is received.
     """
     logger.debug("Moving file from %s to %s", src, dst)
     try:
         with get_session() as session:
-            sel = select(FilesMeta).where(FilesMeta.path == src)
-            res = session.execute(sel).scalar_one()
-            ins = insert(FilesMeta).values(
-                path=dst, meta=res.meta, orig_ctime=res.orig_ctime
+            # Copy the metadata row server side in a single statement
+            ins = insert(FilesMeta).from_select(
+                ["path", "meta", "orig_ctime"],
+                select(literal(dst), FilesMeta.meta, FilesMeta.orig_ctime).where(
+                    FilesMeta.path == src
+                ),
             )
-            session.execute(ins)
+            result = session.execute(ins)
             session.commit()
     except IntegrityError as error:
         logger.debug(f"Failed to insert metadata for {dst}: {error}")
-    except NoResultFound as error:
-        logger.debug(f"Failed to find metadata for {src}: {error}")
-        with get_session() as session:
-            stmt = delete(Files).where(Files.path == src)
-            session.execute(stmt)
-            session.commit()
-        try:
-            os.remove(src)
-        except FileNotFoundError as _error:
-            logger.debug(f"Failed to delete file {src}: {_error}")
-        return
+    else:
+        if result.rowcount == 0:
+            logger.debug(f"Failed to find metadata for {src}")
+            with get_session() as session:
+                stmt = delete(Files).where(Files.path == src)
+                session.execute(stmt)
+                session.commit()
+            try:
+                os.remove(src)
+            except FileNotFoundError as _error:
+                logger.debug(f"Failed to delete file {src}: {_error}")
+            return True
 
     try:
-        os.makedirs(os.path.dirname(dst), exist_ok=True)
-        shutil.copy(src, dst)
-        os.remove(src)
+        if seen_dirs is None:
+            os.makedirs(os.path.dirname(dst), exist_ok=True)
+        else:
+            _makedirs_cached(os.path.dirname(dst), seen_dirs)
+        _relocate_file(src, dst)
     except FileNotFoundError as error:
         logger.debug(f"Failed to move file {src} to {dst}: {error}")
         with get_session() as session:
@@ -916,14 +1271,19 @@ def move_file(
             stmt = delete(FilesMeta).where(FilesMeta.path == src)
             session.execute(stmt)
             session.commit()
+        return True
+    return False
 
 
 def delete_file(
     get_session: Callable[..., Session],
     path: str,
     logger: logging.Logger,
-) -> None:
-    """Delete file."""
+) -> bool:
+    """Delete file and its database row.
+
+    Always returns True, for symmetry with move_file.
+    """
     logger.debug("Deleting file %s", path)
     with get_session() as session:
         stmt = delete(Files).where(Files.path == path)
@@ -936,6 +1296,34 @@ def delete_file(
         os.remove(path)
     except FileNotFoundError as error:
         logger.debug(f"Failed to delete file {path}: {error}")
+    return True
+
+
+def bulk_delete_files(
+    get_session: Callable[..., Session],
+    paths: list[str],
+    logger: logging.Logger,
+    executor: Executor | None = None,
+) -> None:
+    """Delete files and their database rows.
+
+    Works like delete_file, but the rows of all files are deleted using one
+    statement per table.
+    If an executor is given, the files themselves are deleted concurrently using it.
+    """
+    logger.debug("Deleting files %s", paths)
+    with get_session() as session:
+        stmt = delete(Files).where(Files.path.in_(paths))
+        session.execute(stmt)
+        stmt = delete(FilesMeta).where(FilesMeta.path.in_(paths))
+        session.execute(stmt)
+        session.commit()
+
+    for path, error in batch_unlink(paths, executor).items():
+        if isinstance(error, FileNotFoundError):
+            logger.debug(f"Failed to delete file {path}: {error}")
+        else:
+            logger.error(f"Failed to delete file {path}: {error}")
 
 
 def get_files_to_move(
@@ -948,7 +1336,7 @@ def get_files_to_move(
     min_age: timedelta,
     min_bytes: int,
     max_age: timedelta,
-) -> Result[Any]:
+) -> Sequence[Row[Any]]:
     """Get id of files to move."""
     now = utcnow()
 
@@ -974,8 +1362,10 @@ def get_files_to_move(
         min_bytes,
         max_age_timestamp,
     )
-    result = session.execute(stmt)
-    return result
+    # Fetch all rows up front. The rows are processed in chunks by handle_files,
+    # which commits and closes the thread-local session, and that would close a
+    # streaming cursor after the first chunk
+    return session.execute(stmt).all()
 
 
 def get_recordings_to_move(
@@ -1036,16 +1426,16 @@ def force_move_files(
             .where(Files.category == category)
             .where(Files.subcategory == subcategory)
         )
-        result = session.execute(stmt).all()
-        for file in result:
-            handle_file(
+        # Fetch all rows before handle_files commits and closes the session
+        files = session.execute(stmt).tuples().all()
+        for chunk in chunked(files, TIER_CHECK_CHUNK_SIZE):
+            handle_files(
                 get_session,
                 storage,
                 camera_identifier,
                 curr_tier,
                 next_tier,
-                file[0],
-                file[1],
+                chunk,
                 logger,
             )
         session.commit()
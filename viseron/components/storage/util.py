@@ -1,10 +1,18 @@
 """Storage component utility functions."""
 from __future__ import annotations
 
+import heapq
+import logging
 import os
 import threading
+import time
+from collections import Counter
+from collections.abc import Callable, Iterable
+from concurrent.futures import Executor
 from dataclasses import dataclass
 from datetime import timedelta
+from functools import lru_cache
+from itertools import starmap
 from types import TracebackType
 from typing import TYPE_CHECKING, Any
 
@@ -15,6 +23,7 @@ from viseron.components.storage.const import (
     CONFIG_MB,
     CONFIG_MINUTES,
     CONFIG_PATH,
+    UNLINK_CHUNK_SIZE,
 )
 from viseron.events import EventData
 from viseron.types import SnapshotDomain
@@ -22,27 +31,34 @@ from viseron.types import SnapshotDomain
 if TYPE_CHECKING:
     from viseron.domains.camera import AbstractCamera, FailedCamera
 
+LOGGER = logging.getLogger(__name__)
+
 
 def calculate_age(age: dict[str, Any]) -> timedelta:
     """Calculate age in seconds."""
     if not age:
         return timedelta(seconds=0)
 
-    return timedelta(
-        days=age[CONFIG_DAYS] if age[CONFIG_DAYS] else 0,
-        hours=age[CONFIG_HOURS] if age[CONFIG_HOURS] else 0,
-        minutes=age[CONFIG_MINUTES] if age[CONFIG_MINUTES] else 0,
-    )
+    return _calculate_age(age[CONFIG_DAYS], age[CONFIG_HOURS], age[CONFIG_MINUTES])
+
+
+@lru_cache(maxsize=256)
+def _calculate_age(
+    days: int | None, hours: int | None, minutes: int | None
+) -> timedelta:
+    """Calculate age from hashable arguments so the result can be cached."""
+    return timedelta(days=days or 0, hours=hours or 0, minutes=minutes or 0)
 
 
 def calculate_bytes(size: dict[str, Any]) -> int:
     """Calculate size in bytes."""
-    max_bytes = 0
-    if size[CONFIG_MB]:
-        max_bytes += convert_mb_to_bytes(size[CONFIG_MB])
-    if size[CONFIG_GB]:
-        max_bytes += convert_gb_to_bytes(size[CONFIG_GB])
-    return max_bytes
+    return _calculate_bytes(size[CONFIG_MB], size[CONFIG_GB])
+
+
+@lru_cache(maxsize=256)
+def _calculate_bytes(mb: int | None, gb: int | None) -> int:
+    """Calculate bytes from hashable arguments so the result can be cached."""
+    return convert_mb_to_bytes(mb or 0) + convert_gb_to_bytes(gb or 0)
 
 
 def convert_mb_to_bytes(mb: int) -> int:
@@ -55,18 +71,24 @@ def convert_gb_to_bytes(gb: int) -> int:
     return gb * 1024 * 1024 * 1024
 
 
+@lru_cache(maxsize=1024)
+def _join_path(*parts: str) -> str:
+    """Join path parts, caching the result since the same paths are built often."""
+    return os.path.join(*parts)
+
+
 def get_recorder_path(
     tier: dict[str, Any], camera: AbstractCamera | FailedCamera, subcategory: str
 ) -> str:
     """Get recorder path for camera."""
-    return os.path.join(tier[CONFIG_PATH], subcategory, camera.identifier)
+    return _join_path(tier[CONFIG_PATH], subcategory, camera.identifier)
 
 
 def get_thumbnails_path(
     tier: dict[str, Any], camera: AbstractCamera | FailedCamera
 ) -> str:
     """Get thumbnails path for camera."""
-    return os.path.join(tier[CONFIG_PATH], "thumbnails", camera.identifier)
+    return _join_path(tier[CONFIG_PATH], "thumbnails", camera.identifier)
 
 
 def get_snapshots_path(
@@ -75,21 +97,75 @@ def get_snapshots_path(
     domain: SnapshotDomain,
 ) -> str:
     """Get snapshots path for camera."""
-    return os.path.join(tier[CONFIG_PATH], "snapshots", domain.value, camera.identifier)
-
-
-def files_to_move_overlap(events_file_ids, continuous_file_ids):
-    """Find the files that are in both events and continuous delete list."""
-    events_dict = {row.file_id: row for row in events_file_ids}
-    continuous_dict = {row.id: row for row in continuous_file_ids}
-    # Find the matching tuples based on "file_id" and "id"
-    matched_ids = [
-        events_dict[file_id] for file_id in events_dict if file_id in continuous_dict
-    ]
-    return matched_ids
-
-
-@dataclass
+    return _join_path(tier[CONFIG_PATH], "snapshots", domain.value, camera.identifier)
+
+
+def files_to_move_overlap(events_file_ids, continuous_ids: set[int]):
+    """Find the files that are in both events and continuous delete list.
+
+    continuous_ids is the set of file ids in the continuous delete list.
+    """
+    return [row for row in events_file_ids if row.file_id in continuous_ids]
+
+
+def _unlink_directory(directory: str, file_names: list[str]) -> dict[str, OSError]:
+    """Remove files in a single directory and return the ones that failed."""
+    try:
+        dir_fd = os.open(directory or ".", os.O_RDONLY | os.O_DIRECTORY)
+    except OSError as error:
+        return {os.path.join(directory, file_name): error for file_name in file_names}
+
+    failed: dict[str, OSError] = {}
+    try:
+        for file_name in file_names:
+            try:
+                os.unlink(file_name, dir_fd=dir_fd)
+            except OSError as error:
+                failed[os.path.join(directory, file_name)] = error
+    finally:
+        os.close(dir_fd)
+    return failed
+
+
+def batch_unlink(
+    paths: Iterable[str], executor: Executor | None = None
+) -> dict[str, OSError]:
+    """Remove a batch of files and return the paths that could not be removed.
+
+    The paths are grouped by directory, so that the files can be removed relative
+    to a directory file descriptor instead of resolving the full path for every file.
+    If an executor is given, the files are split into chunks of UNLINK_CHUNK_SIZE
+    that are removed concurrently using it, since the files of a tier usually live
+    in the same directory.
+    A file that fails to be removed does not stop the rest of the batch.
+    """
+    directories: dict[str, list[str]] = {}
+    for path in paths:
+        directory, file_name = os.path.split(path)
+        directories.setdefault(directory, []).append(file_name)
+
+    jobs: list[tuple[str, list[str]]] = []
+    for directory, file_names in directories.items():
+        if executor:
+            jobs.extend(
+                (directory, file_names[start : start + UNLINK_CHUNK_SIZE])
+                for start in range(0, len(file_names), UNLINK_CHUNK_SIZE)
+            )
+        else:
+            jobs.append((directory, file_names))
+
+    if executor and len(jobs) > 1:
+        results = executor.map(_unlink_directory, *zip(*jobs))
+    else:
+        results = starmap(_unlink_directory, jobs)
+
+    failed: dict[str, OSError] = {}
+    for result in results:
+        failed.update(result)
+    return failed
+
+
+@dataclass(slots=True, frozen=True)
 class EventFile(EventData):
     """Event data for file events."""
 
@@ -103,27 +179,66 @@ class EventFile(EventData):
 class EventFileCreated(EventFile):
     """Event data for file created events."""
 
+    __slots__ = ()
+
 
-class EventFileDeleted(EventFile):
-    """Event data for file deleted events."""
+@dataclass(slots=True, frozen=True)
+class EventFileDeletedBatch(EventData):
+    """Event data for a batch of deleted files."""
+
+    camera_identifier: str
+    category: str
+    subcategory: str
+    paths: tuple[str, ...]
 
 
 class RequestedFilesCount:
-    """Context manager for keeping track of recently requested files."""
+    """Context manager for keeping track of recently requested files.
+
+    Filenames are forgotten two seconds after they were requested. The expirations
+    are kept in a heap which is drained by a single reaper thread, that is only
+    running while there are filenames left to expire.
+    """
 
     def __init__(self) -> None:
         self.count = 0
-        self.filenames: list[str] = []
+        self.filenames: Counter[str] = Counter()
+        self._expirations: list[tuple[float, str]] = []
+        self._condition = threading.Condition()
+        self._reaper: threading.Thread | None = None
 
     def remove_filename(self, filename: str) -> None:
-        """Remove a filename from the list of active filenames."""
-        self.filenames.remove(filename)
+        """Remove a filename from the active filenames."""
+        with self._condition:
+            self.filenames[filename] -= 1
+            if self.filenames[filename] <= 0:
+                del self.filenames[filename]
+
+    def _reap(self) -> None:
+        """Remove filenames as they expire."""
+        with self._condition:
+            while self._expirations:
+                deadline, filename = self._expirations[0]
+                now = time.monotonic()
+                if deadline > now:
+                    self._condition.wait(deadline - now)
+                    continue
+                heapq.heappop(self._expirations)
+                self.remove_filename(filename)
+            self._reaper = None
 
     def __call__(self, filename: str) -> RequestedFilesCount:
-        """Add a filename to the list of active filenames."""
-        self.filenames.append(filename)
-        timer = threading.Timer(2, self.remove_filename, args=(filename,))
-        timer.start()
+        """Add a filename to the active filenames."""
+        with self._condition:
+            self.filenames[filename] += 1
+            heapq.heappush(self._expirations, (time.monotonic() + 2, filename))
+            if self._reaper is None:
+                self._reaper = threading.Thread(
+                    target=self._reap,
+                    name="requested_files_reaper",
+                    daemon=True,
+                )
+                self._reaper.start()
         return self
 
     def __enter__(self):
@@ -139,3 +254,82 @@ class RequestedFilesCount:
     ) -> None:
         """Decrement the counter when exiting the context."""
         self.count -= 1
+
+
+class Debouncer:
+    """Run a callback for paths once they have not been rescheduled for a delay.
+
+    A single instance is shared by all tier handlers. Expired paths are passed to
+    their callback in one call per callback. The worker thread is only running
+    while there are paths pending, so idle handlers cost no threads.
+    """
+
+    def __init__(self, delay: float = 1) -> None:
+        self._delay = delay
+        self._pending: dict[str, tuple[float, Callable[[list[str]], None]]] = {}
+        self._running: set[Callable[[list[str]], None]] = set()
+        self._condition = threading.Condition()
+        self._worker: threading.Thread | None = None
+
+    def schedule(self, path: str, callback: Callable[[list[str]], None]) -> None:
+        """Schedule callback for path, pushing back any pending deadline."""
+        with self._condition:
+            # The delay is constant, so a new deadline is never earlier than the
+            # one the worker is currently waiting for
+            self._pending[path] = (time.monotonic() + self._delay, callback)
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._run,
+                    name="storage_debouncer",
+                    daemon=True,
+                )
+                self._worker.start()
+
+    def _run(self) -> None:
+        """Dispatch paths as their deadlines pass."""
+        while True:
+            with self._condition:
+                batches: dict[Callable[[list[str]], None], list[str]] = {}
+                while not batches:
+                    if not self._pending:
+                        self._worker = None
+                        return
+                    now = time.monotonic()
+                    for path, (deadline, callback) in self._pending.items():
+                        if deadline <= now:
+                            batches.setdefault(callback, []).append(path)
+                    if not batches:
+                        self._condition.wait(
+                            min(deadline for deadline, _ in self._pending.values())
+                            - now
+                        )
+                for paths in batches.values():
+                    for path in paths:
+                        del self._pending[path]
+                self._running.update(batches)
+
+            for callback, paths in batches.items():
+                try:
+                    callback(paths)
+                except Exception:  # pylint: disable=broad-except
+                    LOGGER.exception("Error in debounced callback %s", callback)
+
+            with self._condition:
+                self._running.difference_update(batches)
+                self._condition.notify_all()
+
+    def flush(self, callback: Callable[[list[str]], None]) -> None:
+        """Run callback now for its pending paths.
+
+        Waits for any call to callback already in progress, so that no calls are
+        made once this returns, unless new paths are scheduled.
+        """
+        with self._condition:
+            while callback in self._running:
+                self._condition.wait()
+            paths = [path for path, (_, cb) in self._pending.items() if cb == callback]
+            for path in paths:
+                del self._pending[path]
+            self._condition.notify_all()
+        if paths:
+            callback(paths)
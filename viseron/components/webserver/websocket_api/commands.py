@@ -12,8 +12,11 @@ import tornado
 import voluptuous as vol
 from debouncer import DebounceOptions, debounce
 
-from viseron.components.storage.const import EVENT_FILE_CREATED, EVENT_FILE_DELETED
-from viseron.components.storage.util import EventFileCreated, EventFileDeleted
+from viseron.components.storage.const import (
+    EVENT_FILE_CREATED,
+    EVENT_FILE_DELETED_BATCH,
+)
+from viseron.components.storage.util import EventFileCreated, EventFileDeletedBatch
 from viseron.components.webserver.auth import Group
 from viseron.components.webserver.const import (
     WS_ERROR_NOT_FOUND,
@@ -338,7 +341,7 @@ def subscribe_timespans(connection: WebSocketHandler, message) -> None:
         ),
     )
     def forward_timespans(
-        _event: Event[EventFileCreated] | Event[EventFileDeleted],
+        _event: Event[EventFileCreated] | Event[EventFileDeletedBatch],
     ) -> None:
         """Forward event to WebSocket connection."""
         send_timespans()
@@ -359,11 +362,10 @@ def subscribe_timespans(connection: WebSocketHandler, message) -> None:
         )
         subs.append(
             connection.vis.listen_event(
-                EVENT_FILE_DELETED.format(
+                EVENT_FILE_DELETED_BATCH.format(
                     camera_identifier=camera_identifier,
                     category="recorder",
                     subcategory="segments",
-                    file_name="*",
                 ),
                 forward_timespans,
                 ioloop=tornado.ioloop.IOLoop.current(),
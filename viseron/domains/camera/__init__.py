@@ -15,7 +15,6 @@ from uuid import uuid4
 import cv2
 import imutils
 from sqlalchemy import or_, select
-from typing_extensions import assert_never
 
 from viseron.components import DomainToSetup
 from viseron.components.data_stream import (
@@ -136,6 +135,14 @@ class AbstractCamera(ABC):
         self.snapshots_motion_folder: str = self._storage.get_snapshots_path(
             self, SnapshotDomain.MOTION_DETECTOR
         )
+        self._snapshots_folders: dict[SnapshotDomain, str] = {
+            SnapshotDomain.OBJECT_DETECTOR: self.snapshots_object_folder,
+            SnapshotDomain.FACE_RECOGNITION: self.snapshots_face_folder,
+            SnapshotDomain.LICENSE_PLATE_RECOGNITION: (
+                self.snapshots_license_plate_folder
+            ),
+            SnapshotDomain.MOTION_DETECTOR: self.snapshots_motion_folder,
+        }
 
         self.fragmenter: Fragmenter = Fragmenter(vis, self)
         if self.config[CONFIG_PASSWORD]:
@@ -364,15 +371,7 @@ class AbstractCamera(ABC):
         return ret, False
 
     def _get_folder(self, domain: SnapshotDomain) -> str:
-        if domain is SnapshotDomain.OBJECT_DETECTOR:
-            return self.snapshots_object_folder
-        if domain is SnapshotDomain.FACE_RECOGNITION:
-            return self.snapshots_face_folder
-        if domain is SnapshotDomain.LICENSE_PLATE_RECOGNITION:
-            return self.snapshots_license_plate_folder
-        if domain == SnapshotDomain.MOTION_DETECTOR:
-            return self.snapshots_motion_folder
-        assert_never(domain)
+        return self._snapshots_folders[domain]
 
     def save_snapshot(
         self,
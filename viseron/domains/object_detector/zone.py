@@ -4,6 +4,8 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING, Any
 
+import numpy as np
+
 from viseron.domains.camera.const import DOMAIN as CAMERA_DOMAIN
 from viseron.domains.object_detector.const import CONFIG_LABEL_LABEL
 from viseron.domains.object_detector.detected_object import EventDetectedObjectsData
@@ -50,6 +52,11 @@ class Zone:
         self._coordinates = generate_numpy_from_coordinates(
             zone_config[CONFIG_COORDINATES]
         )
+        # Stored in the layout expected by cv2.polylines to avoid a conversion
+        # every time the zone is drawn
+        self._polyline_coordinates = np.ascontiguousarray(
+            self._coordinates, dtype=np.int32
+        ).reshape(-1, 1, 2)
         self._camera_resolution = self._camera.resolution
 
         self._name: str = zone_config[CONFIG_ZONE_NAME]
@@ -103,6 +110,11 @@ class Zone:
         """Return zone coordinates."""
         return self._coordinates
 
+    @property
+    def polyline_coordinates(self) -> np.ndarray:
+        """Return zone coordinates as a contiguous int32 array for cv2.polylines."""
+        return self._polyline_coordinates
+
     @property
     def object_filters(self):
         """Return zone object filters."""
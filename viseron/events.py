@@ -30,6 +30,9 @@ class Event(Generic[T]):
 class EventData:
     """Base class that holds event data."""
 
+    # Allows slotted subclasses to skip the per instance __dict__
+    __slots__ = ()
+
     # Indicates if the event is a JSON serializable object
     json_serializable: bool = True
 
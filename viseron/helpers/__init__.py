@@ -11,6 +11,7 @@ import socket
 import time
 import tracemalloc
 import urllib.parse
+from functools import lru_cache
 from queue import Full, Queue
 from typing import TYPE_CHECKING, Any, Literal, overload
 
@@ -110,6 +111,23 @@ def scale_bounding_box(
     )
 
 
+def calculate_absolute_coords_batch(
+    bounding_boxes: np.ndarray, frame_res: tuple[int, int]
+) -> np.ndarray:
+    """Convert an (N, 4) array of relative coords to absolute."""
+    absolute = np.multiply(
+        np.asarray(bounding_boxes, dtype=np.float64),
+        np.array(
+            [frame_res[0], frame_res[1], frame_res[0], frame_res[1]],
+            dtype=np.float64,
+        ),
+    )
+    # Floor in place to avoid another temporary array. A plain astype would
+    # truncate towards zero, which is wrong for boxes extending past the frame edge
+    np.floor(absolute, out=absolute)
+    return absolute.astype(np.int32)
+
+
 def draw_bounding_box_relative(
     frame, bounding_box, frame_res, color=(255, 0, 0), thickness=1
 ) -> Any:
@@ -273,21 +291,14 @@ def draw_objects(
 ) -> None:
     """Draw objects on supplied frame."""
     if resolution:
-        bounding_boxes = np.array(
-            [
-                list(
-                    calculate_absolute_coords(
-                        (
-                            detected_object.rel_x1,
-                            detected_object.rel_y1,
-                            detected_object.rel_x2,
-                            detected_object.rel_y2,
-                        ),
-                        resolution,
-                    )
-                )
-                for detected_object in detected_objects
-            ]
+        bounding_boxes = calculate_absolute_coords_batch(
+            np.array(
+                [
+                    detected_object.rel_coordinates
+                    for detected_object in detected_objects
+                ]
+            ),
+            resolution,
         )
     else:
         bounding_boxes = np.array(
@@ -307,14 +318,27 @@ def draw_objects(
 
 
 def draw_zones(frame, zones) -> None:
-    """Draw zones on supplied frame."""
+    """Draw zones on supplied frame.
+
+    Zones are grouped by color so that the outlines are drawn using at most two
+    polylines calls.
+    """
+    zones_with_objects = [
+        zone.polyline_coordinates for zone in zones if zone.objects_in_zone
+    ]
+    zones_without_objects = [
+        zone.polyline_coordinates for zone in zones if not zone.objects_in_zone
+    ]
+    if zones_with_objects:
+        cv2.polylines(frame, zones_with_objects, True, (0, 255, 0), 2)
+    if zones_without_objects:
+        cv2.polylines(frame, zones_without_objects, True, (0, 0, 255), 2)
+
     for zone in zones:
         if zone.objects_in_zone:
             color = (0, 255, 0)
         else:
             color = (0, 0, 255)
-        cv2.polylines(frame, [zone.coordinates], True, color, 2)
-
         cv2.putText(
             frame,
             zone.name,
@@ -407,18 +431,55 @@ def pop_if_full(
     name: str = "unknown",
     warn: bool = False,
 ) -> None:
-    """If queue is full, pop oldest item and put the new item."""
+    """If queue is full, pop oldest item and put the new item.
+
+    Full queues are detected up front instead of relying on the Full exception,
+    since the queues passed here are full most of the time.
+    For a queue.Queue the check, pop and put is done atomically while holding the
+    queue mutex, so a concurrent producer cannot fill the freed slot in between.
+    """
+    if isinstance(queue, Queue):
+        with queue.mutex:
+            # pylint: disable=protected-access
+            full = 0 < queue.maxsize <= queue._qsize()
+            if full:
+                queue._get()
+            queue._put(item)
+            # pylint: enable=protected-access
+            queue.unfinished_tasks += 1
+            queue.not_empty.notify()
+        if full and warn:
+            logger.warning(f"{name} queue is full. Removing oldest entry")
+        return
+
+    # Tornado queues are only accessed from the IOLoop thread, so the check can't
+    # race with another producer
+    if isinstance(queue, tq.Queue):
+        if queue.full():
+            if warn:
+                logger.warning(f"{name} queue is full. Removing oldest entry")
+            queue.get_nowait()
+        queue.put_nowait(item)
+        return
+
+    # multiprocessing queues expose no lock to make the check atomic, so rely on
+    # the exception instead
     try:
         queue.put_nowait(item)
-    except (Full, tq.QueueFull):
+    except Full:
         if warn:
             logger.warning(f"{name} queue is full. Removing oldest entry")
         queue.get()
         queue.put_nowait(item)
 
 
+@lru_cache(maxsize=1024)
 def slugify(text: str) -> str:
-    """Slugify a given text."""
+    """Slugify a given text.
+
+    Results are cached since the same camera, zone and object names are slugified
+    repeatedly.
+    """
     return unicode_slug.slugify(text, separator="_")
 
 
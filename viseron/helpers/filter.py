@@ -25,6 +25,22 @@ if TYPE_CHECKING:
 class Filter:
     """Filter a recorded object against a configured label."""
 
+    __slots__ = (
+        "_camera_resolution",
+        "_mask",
+        "_label",
+        "_confidence",
+        "_width_min",
+        "_width_max",
+        "_height_min",
+        "_height_max",
+        "_trigger_recorder",
+        "_store",
+        "_store_interval",
+        "_require_motion",
+        "_last_stored",
+    )
+
     def __init__(self, camera_resolution, object_filter, mask) -> None:
         self._camera_resolution = camera_resolution
         self._mask = mask
@@ -43,27 +59,6 @@ class Filter:
 
         self._last_stored = utcnow() - self._store_interval
 
-    def filter_confidence(self, obj: DetectedObject) -> bool:
-        """Return if confidence filter is met."""
-        if obj.confidence > self._confidence:
-            return True
-        obj.filter_hit = "confidence"
-        return False
-
-    def filter_width(self, obj: DetectedObject) -> bool:
-        """Return if width filter is met."""
-        if self._width_max > obj.rel_width > self._width_min:
-            return True
-        obj.filter_hit = "width"
-        return False
-
-    def filter_height(self, obj: DetectedObject) -> bool:
-        """Return if height filter is met."""
-        if self._height_max > obj.rel_height > self._height_min:
-            return True
-        obj.filter_hit = "height"
-        return False
-
     def filter_mask(self, obj: DetectedObject) -> bool:
         """Return True if object is within mask."""
         for mask in self._mask:
@@ -73,13 +68,21 @@ class Filter:
         return True
 
     def filter_object(self, obj: DetectedObject) -> bool:
-        """Return if filters are met."""
-        return (
-            self.filter_confidence(obj)
-            and self.filter_width(obj)
-            and self.filter_height(obj)
-            and self.filter_mask(obj)
-        )
+        """Return if filters are met.
+
+        Each bound is compared once, and filter_hit is set to the first filter that
+        rejects the object.
+        """
+        if not obj.confidence > self._confidence:
+            obj.filter_hit = "confidence"
+            return False
+        if not self._width_max > obj.rel_width > self._width_min:
+            obj.filter_hit = "width"
+            return False
+        if not self._height_max > obj.rel_height > self._height_min:
+            obj.filter_hit = "height"
+            return False
+        return self.filter_mask(obj)
 
     def should_store(self, obj: DetectedObject) -> bool:
         """Return True if object should be stored."""